@@ -12,10 +12,15 @@ import numpy as np
 from src.config import Config
 from src.utils.logger_setup import logger
 
+# Candle interval lengths in minutes
+_INTERVAL_MINUTES = {'1m': 1, '5m': 5, '15m': 15, '1h': 60}
+
 
 class MockTopStepXClient:
     """Mock client for testing without real API"""
     
+    supports_websocket = False  # No real-time feed; the bot falls back to REST
+    
     def __init__(self):
         self.config = Config
         self.is_connected = False
@@ -25,6 +30,7 @@ class MockTopStepXClient:
         self.current_price = 2050.0
         self.cancelled_orders = []  # Track cancelled orders for testing
         self.order_counter = 1000  # For generating order IDs
+        self._rng = np.random.default_rng()  # Source for generated market data
         
         logger.info("Mock TopStepX Client initialized")
     
@@ -117,9 +123,9 @@ class MockTopStepXClient:
             'bid': self.current_price - spread/2,
             'ask': self.current_price + spread/2,
             'last': self.current_price,
-            'bid_size': np.random.randint(10, 100),
-            'ask_size': np.random.randint(10, 100),
-            'volume': np.random.randint(5000, 20000)
+            'bid_size': int(self._rng.integers(10, 100)),
+            'ask_size': int(self._rng.integers(10, 100)),
+            'volume': int(self._rng.integers(5000, 20000))
         }
     
     async def _get_contract_by_symbol(self, symbol: str) -> Optional[Dict]:
@@ -141,43 +147,48 @@ class MockTopStepXClient:
         limit: int = 100
     ) -> Optional[List[Dict]]:
         """Mock historical data"""
-        candles = []
         current_time = datetime.now(timezone.utc)
-        interval_minutes = {'1m': 1, '5m': 5, '15m': 15, '1h': 60}.get(interval, 15)
+        interval_minutes = _INTERVAL_MINUTES.get(interval, 15)
         
-        for i in range(limit):
-            timestamp = current_time.timestamp() * 1000 - (i * interval_minutes * 60 * 1000)
-            base_price = self.current_price - (i * 0.1)
-            
-            open_price = base_price + np.random.uniform(-2, 2)
-            close_price = open_price + np.random.uniform(-3, 3)
-            high_price = max(open_price, close_price) + np.random.uniform(0, 2)
-            low_price = min(open_price, close_price) - np.random.uniform(0, 2)
-            
-            candles.append({
-                'time': int(timestamp),
-                'o': round(open_price, 2),
-                'h': round(high_price, 2),
-                'l': round(low_price, 2),
-                'c': round(close_price, 2),
-                'v': np.random.randint(100, 1000)
-            })
+        # Draw every candle at once; bars_back runs oldest first
+        rng = self._rng
+        bars_back = np.arange(limit - 1, -1, -1)
+        timestamps = current_time.timestamp() * 1000 - bars_back * (interval_minutes * 60 * 1000)
+        base_price = self.current_price - bars_back * 0.1
+        
+        # One contiguous draw of unit uniforms, scaled per component
+        u = rng.random((4, limit))
+        open_price = base_price + (u[0] * 4 - 2)     # [-2, 2)
+        close_price = open_price + (u[1] * 6 - 3)    # [-3, 3)
+        high_price = np.maximum(open_price, close_price) + u[2] * 2  # [0, 2)
+        low_price = np.minimum(open_price, close_price) - u[3] * 2   # [0, 2)
+        volume = rng.integers(100, 1000, limit)
         
-        return list(reversed(candles))
+        return [
+            {'time': t, 'o': o, 'h': h, 'l': l, 'c': c, 'v': v}
+            for t, o, h, l, c, v in zip(
+                timestamps.astype(np.int64).tolist(),
+                np.round(open_price, 2).tolist(),
+                np.round(high_price, 2).tolist(),
+                np.round(low_price, 2).tolist(),
+                np.round(close_price, 2).tolist(),
+                volume.tolist()
+            )
+        ]
     
     async def handle_market_data_stream(self):
         """Mock market data stream"""
         while self.is_connected:
             # Update price randomly
-            self.current_price += np.random.uniform(-0.5, 0.5)
+            self.current_price += float(self._rng.uniform(-0.5, 0.5))
             
             yield {
                 'type': 'quote',
                 'symbol': 'MGC',
                 'bid': self.current_price - 0.1,
                 'ask': self.current_price + 0.1,
-                'bid_size': np.random.randint(10, 100),
-                'ask_size': np.random.randint(10, 100)
+                'bid_size': int(self._rng.integers(10, 100)),
+                'ask_size': int(self._rng.integers(10, 100))
             }
             
             await asyncio.sleep(1)  # Update every second
@@ -188,7 +199,7 @@ class MockTopStepXClient:
             # Simulate position updates
             for position in self.mock_positions:
                 # Random P&L changes
-                pnl_change = np.random.uniform(-50, 50)
+                pnl_change = float(self._rng.uniform(-50, 50))
                 position['unrealized_pnl'] = position.get('unrealized_pnl', 0) + pnl_change
                 
                 yield {
@@ -16,6 +16,8 @@ from src.utils.logger_setup import logger
 class TopStepXClient:
     """Client for TopStepX API interactions"""
     
+    supports_websocket = True  # Real-time data is available over the TopStepX hubs
+    
     def __init__(self):
         self.config = Config
         self.api_key = self.config.TOPSTEP_API_KEY
@@ -52,8 +54,14 @@ class TopStepXClient:
     async def connect(self) -> bool:
         """Establish connection to TopStepX API"""
         try:
-            # Create HTTP session
+            # Create HTTP session; every REST call shares it, so keep connections
+            # alive between requests instead of paying TCP/TLS setup each time
             self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                ),
                 timeout=aiohttp.ClientTimeout(total=30)
             )
             
@@ -3,38 +3,89 @@
 import asyncio
 import json
 import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
+import numpy as np
 import pandas as pd
+from cachetools import TLRUCache
 
 # Local imports
-from src.api.mock_topstep_client import MockTopStepXClient
 from src.api.topstep_client import TopStepXClient
 from src.api.topstep_websocket_client import TopStepXWebSocketClient
 from src.core.base_bot import BaseGoldBot
 from src.utils.data_validator import DataValidationError
 from src.utils.logger_setup import logger
 from src.utils.partial_profit_manager import PartialProfitManager
+from src.utils.tick_buffer import TickRingBuffer
+
+# Multi-timeframe confluence weights
+_TF_WEIGHTS = {
+    '1m': 0.2,   # Entry timeframe
+    '5m': 0.5,   # Primary timeframe
+    '15m': 0.3   # Higher timeframe
+}
+
+# Trend alignment weights (higher timeframes count more)
+_TREND_WEIGHTS = {'1m': 0.3, '5m': 0.5, '15m': 0.7}
+
+# Candles requested per timeframe (400 everywhere for better pattern detection)
+_TIMEFRAME_LIMITS = {
+    '1m': 400,   # 6.7 hours of data
+    '5m': 400,   # 33.3 hours of data
+    '15m': 400,  # 100 hours (4.2 days) of data
+    '30m': 400,  # 200 hours (8.3 days) of data
+    '1h': 400    # 400 hours (16.7 days) of data
+}
+
+# TopStep candle fields and the DataFrame columns they map to
+_CANDLE_FIELDS = (
+    ('o', 'open'),
+    ('h', 'high'),
+    ('l', 'low'),
+    ('c', 'close'),
+    ('v', 'volume')
+)
+
+# Log a real-time price line every 128 ticks
+_TICK_LOG_MASK = 128 - 1
+_TICK_LOG_FMT = "📊 Real-time Price: ${:.2f} | Bid: ${:.2f} | Ask: ${:.2f} | Ticks: {:d} | Dropped: {:d}".format
+
+# Pattern scores are capped at this value, so nothing can beat it
+_MAX_PATTERN_SCORE = 10.0
+
+# Order side -> (API side string, quote field the market order is expected to fill at)
+_ORDER_SIDES = {'BUY': ('Buy', 'ask'), 'SELL': ('Sell', 'bid')}
 
 
 class LiveGoldBot(BaseGoldBot):
     """Live Blue2.0 Trading Bot using TopStepX API"""
     
-    def __init__(self, use_mock_api=False):
+    def __init__(self, use_mock_api=False, use_websocket=True):
         super().__init__()
         
+        # Stream real-time quotes over WebSocket; when False the bot relies on REST polling only
+        self.use_websocket = use_websocket
+        
         # Use mock API for testing
         if use_mock_api:
+            # Imported lazily so production runs never load the mock
+            from src.api.mock_topstep_client import MockTopStepXClient
             logger.info("Using MOCK API client for testing")
             self.api_client = MockTopStepXClient()
         else:
             self.api_client = TopStepXClient()
             
-        self.market_data_buffer = []
+        self.market_data_buffer = TickRingBuffer(capacity=1000)  # Oldest ticks are overwritten
         self.last_candle_update = None
-        self.candle_cache = {}
+        self.candle_cache = TLRUCache(
+            maxsize=self.config.CANDLE_CACHE_MAX_ENTRIES,
+            ttu=self._candle_cache_expiry,
+            timer=time.time  # Wall clock, so expiry lines up with bar boundaries
+        )
         
         # WebSocket client for real-time data
         self.ws_client = None
@@ -43,23 +94,62 @@ class LiveGoldBot(BaseGoldBot):
         # Multi-timeframe analysis cache
         self.mtf_cache = {}
         self.mtf_patterns = {}
+        self._pattern_levels = {}
+        self._pattern_levels_source = None  # mtf_patterns dict the levels were built from
+        self._timeframe_trends = {}
+        self._timeframe_trends_source = None  # mtf_data dict the trends were computed from
+        self._avg_volumes = {}
+        self._avg_volumes_source = None  # mtf_data dict the volume averages were computed from
         
         # Real-time price monitoring
-        self.last_tick_time = None
+        self._last_tick_ns = None  # Wall-clock ns of the last tick (see last_tick_time)
         self.tick_count = 0
         
+        # Set by the quote handler when a 1-minute bar closes so the trading
+        # loop can wake up instead of waiting out its full delay (created in connect())
+        self._new_bar_event = None
+        self._last_bar_minute = None  # Minutes since epoch of the last tick
+        
+        # Quote ticks are queued by the WebSocket callback and processed by a consumer task (created in connect())
+        self._tick_queue = None
+        self._dropped_ticks = 0  # Ticks discarded because the consumer fell behind
+        
+        # Latest top of book from the quote stream
+        self._bid = 0.0
+        self._ask = 0.0
+        self._last_quote_mono = None  # time.monotonic() of the last quote
+        self._tick_consumer_task = None
+        
+        # Wall-clock time sampled once per trading loop iteration
+        self._tick_now = None
+        
+        # Active contract cache (contract can only roll over on a day change)
+        self._active_contract_date = None
+        self._active_contract_symbol = None
+        
         # Initialize tracking variables for monitoring
         self.total_trades = 0
         self.patterns_found_today = 0
         self.high_quality_patterns_today = 0
         self.winning_trades = 0
         self.losing_trades = 0
-        self.trade_history = []  # Store all trade executions
         
         # Account balance cache
         self._account_balance = None
         self._balance_last_fetched = None
         
+        # Status file (logs directory is created by the base class)
+        self._status_file = Path('logs/status.json')
+        
+        # Status file change tracking (skip rewrites when nothing changed)
+        self._last_status_hash = None
+        self._last_status_write = 0.0
+        
+        # Config values read on every position update / fill (config is fixed after startup)
+        self._symbol = self.config.SYMBOL
+        self._loss_threshold = -self.config.DAILY_LOSS_LIMIT
+        self._point_value = self.config.TICK_VALUE / self.config.TICK_SIZE  # Dollars per contract per 1.0 price move
+        
         # Protective orders tracking
         self.protective_orders = {}  # Maps position_id to {'stop_order_id': xxx, 'target_order_id': xxx}
         
@@ -71,9 +161,21 @@ class LiveGoldBot(BaseGoldBot):
         logger.info(f"Market: {self.config.TOPSTEP_MARKET}")
         logger.info(f"Partial Profits: {'ENABLED' if self.config.ENABLE_PARTIAL_PROFITS else 'DISABLED'}")
     
+    @property
+    def last_tick_time(self) -> Optional[datetime]:
+        """Time of the last quote tick, built on demand rather than per tick"""
+        if self._last_tick_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_tick_ns / 1e9, timezone.utc)
+    
     async def connect(self) -> bool:
         """Connect to TopStepX API and WebSocket"""
         try:
+            # Created here rather than in __init__ so they bind to the running
+            # event loop (on Python < 3.10 they bind to the loop current at creation)
+            self._new_bar_event = asyncio.Event()
+            self._tick_queue = asyncio.Queue(maxsize=4096)
+            
             # Connect to REST API first
             if not await self.api_client.connect():
                 logger.error("Failed to connect to TopStepX API")
@@ -86,30 +188,31 @@ class LiveGoldBot(BaseGoldBot):
                 self.partial_profit_manager = PartialProfitManager(self.api_client)
                 logger.info("Partial Profit Manager initialized")
             
-            # Get contract ID based on configuration
+            # Contract lookup and account info are independent, so fetch them together
             contract_symbol = self.config.SYMBOL  # This will be 'MNQ' or 'NQ'
-            contract = await self.api_client._get_contract_by_symbol(contract_symbol)
+            contract, account_info = await asyncio.gather(
+                self.api_client._get_contract_by_symbol(contract_symbol),
+                self.api_client.get_account_info()
+            )
+            
+            # Get contract ID based on configuration
             if contract:
                 self.contract_id = contract.get("id")
                 logger.info(f"Found {contract_symbol} contract: {self.contract_id}")
             else:
                 logger.error(f"Could not find {contract_symbol} contract")
             
-            # Get initial account info
-            account_info = await self.api_client.get_account_info()
+            # Initial account info and balance
             if account_info:
                 logger.info(f"Connected to account: {account_info.get('username')}")
                 logger.info(f"Account balance: ${account_info.get('balance', 0):.2f}")
-            
-            # Fetch initial account balance
-            account_info = await self.api_client.get_account_info()
-            if account_info:
                 self._account_balance = account_info.get('balance', self.config.DEFAULT_ACCOUNT_SIZE)
-                self._balance_last_fetched = datetime.now()
+                self._balance_last_fetched = datetime.now(timezone.utc)
             
             # Connect WebSocket for real-time data
-            if self.contract_id and not isinstance(self.api_client, MockTopStepXClient):
+            if self.contract_id and self.use_websocket and self.api_client.supports_websocket:
                 logger.info("Connecting to WebSocket for real-time data...")
+                self._tick_consumer_task = asyncio.create_task(self._tick_consumer())
                 self.ws_client = TopStepXWebSocketClient(self.api_client.session_token)
                 
                 # Register callbacks
@@ -117,9 +220,11 @@ class LiveGoldBot(BaseGoldBot):
                 self.ws_client.on_trade(self._handle_trade_update)
                 
                 if await self.ws_client.connect():
-                    # Subscribe to contract quotes
-                    await self.ws_client.subscribe_quotes(self.contract_id)
-                    await self.ws_client.subscribe_trades(self.contract_id)
+                    # Subscribe to contract quotes and trades
+                    await asyncio.gather(
+                        self.ws_client.subscribe_quotes(self.contract_id),
+                        self.ws_client.subscribe_trades(self.contract_id)
+                    )
                     logger.info(f"✅ WebSocket connected - receiving real-time data for {contract_symbol}!")
                 else:
                     logger.warning("WebSocket connection failed, falling back to REST API")
@@ -142,6 +247,11 @@ class LiveGoldBot(BaseGoldBot):
             if self.ws_client:
                 await self.ws_client.disconnect()
             
+            # Stop processing queued ticks
+            if self._tick_consumer_task:
+                self._tick_consumer_task.cancel()
+                self._tick_consumer_task = None
+            
             # Disconnect API client
             await self.api_client.disconnect()
             
@@ -151,52 +261,79 @@ class LiveGoldBot(BaseGoldBot):
             logger.error(f"Disconnect error: {e}")
     
     def _handle_quote_update(self, contract_id: str, quote_data: dict):
-        """Handle real-time quote updates from WebSocket"""
-        try:
-            # Update current price
-            bid = quote_data.get('bestBid', 0)
-            ask = quote_data.get('bestAsk', 0)
-            
-            if bid > 0 and ask > 0:
-                self.current_price = (bid + ask) / 2
-                self.last_tick_time = datetime.now(timezone.utc)
-                self.tick_count += 1
-                
-                # Store tick data for analysis
-                self.market_data_buffer.append({
-                    'timestamp': self.last_tick_time,
-                    'price': self.current_price,
-                    'bid': bid,
-                    'ask': ask,
-                    'bid_size': quote_data.get('bestBidSize', 0),
-                    'ask_size': quote_data.get('bestAskSize', 0)
-                })
-                
-                # Keep buffer size manageable
-                if len(self.market_data_buffer) > 1000:
-                    self.market_data_buffer = self.market_data_buffer[-1000:]
-                    
-                # Log every 100th tick
-                if self.tick_count % 100 == 0:
-                    logger.info(f"📊 Real-time Price: ${self.current_price:.2f} | Bid: ${bid:.2f} | Ask: ${ask:.2f} | Ticks: {self.tick_count}")
-                    
-        except Exception as e:
-            logger.error(f"Error handling quote update: {e}")
+        """Handle real-time quote updates from WebSocket
+        
+        Runs on the event loop for every quote, so it only records the price
+        and hands the tick to the consumer task for the remaining work.
+        """
+        bid = quote_data.get('bestBid', 0)
+        ask = quote_data.get('bestAsk', 0)
+        if bid > 0 and ask > 0:
+            self._update_mid(bid, ask)
+            tick = (time.time_ns(), self.current_price, bid, ask,
+                    quote_data.get('bestBidSize', 0), quote_data.get('bestAskSize', 0))
+            try:
+                self._tick_queue.put_nowait(tick)
+            except asyncio.QueueFull:
+                # Falling behind: drop the oldest tick rather than the newest
+                self._tick_queue.get_nowait()
+                self._tick_queue.put_nowait(tick)
+                self._dropped_ticks += 1
+    
+    def _update_mid(self, bid: float, ask: float) -> None:
+        """Record the latest top of book; current_price is the single source of the mid"""
+        self._bid = bid
+        self._ask = ask
+        self.current_price = (bid + ask) / 2
+        self._last_quote_mono = time.monotonic()
+    
+    def _has_fresh_quote(self) -> bool:
+        """Whether the streamed price is recent enough to trade on"""
+        return (self.current_price > 0 and self._last_quote_mono is not None and
+                time.monotonic() - self._last_quote_mono < self.config.QUOTE_MAX_AGE_SECONDS)
+    
+    async def _tick_consumer(self) -> None:
+        """Process queued quote ticks off the WebSocket callback path"""
+        while True:
+            timestamp_ns, price, bid, ask, bid_size, ask_size = await self._tick_queue.get()
+            try:
+                self._process_tick(timestamp_ns, price, bid, ask, bid_size, ask_size)
+            except Exception:
+                logger.exception("Error handling quote update")
+    
+    def _process_tick(self, timestamp_ns: int, price: float, bid: float, ask: float,
+                      bid_size: int, ask_size: int) -> None:
+        """Record a quote tick and signal bar closes"""
+        self._last_tick_ns = timestamp_ns
+        self.tick_count += 1
+        
+        # First tick in a new minute means the previous bar has closed
+        bar_minute = timestamp_ns // 60_000_000_000
+        if bar_minute != self._last_bar_minute:
+            if self._last_bar_minute is not None:
+                self._new_bar_event.set()
+            self._last_bar_minute = bar_minute
+        
+        # Store tick data for analysis
+        self.market_data_buffer.append(timestamp_ns, price, bid, ask, bid_size, ask_size)
+        
+        # Log every Nth tick (power of two, so the check is a bitmask)
+        if self.tick_count & _TICK_LOG_MASK == 0:
+            logger.info(_TICK_LOG_FMT(price, bid, ask, self.tick_count, self._dropped_ticks))
     
     def _handle_trade_update(self, contract_id: str, trades: list):
         """Handle real-time trade updates from WebSocket"""
         try:
             for trade in trades:
-                price = trade.get('price', 0)
                 volume = trade.get('volume', 0)
-                trade_type = "BUY" if trade.get('type') == 0 else "SELL"
                 
                 # Log significant trades
                 if volume > 10:  # Log larger trades
-                    logger.debug(f"Trade: {trade_type} {volume} @ ${price:.2f}")
+                    trade_type = "BUY" if trade.get('type') == 0 else "SELL"
+                    logger.debug(f"Trade: {trade_type} {volume} @ ${trade.get('price', 0):.2f}")
                     
-        except Exception as e:
-            logger.error(f"Error handling trade update: {e}")
+        except Exception:
+            logger.exception("Error handling trade update")
     
     async def _handle_fill(self, event: Dict) -> None:
         """Handle order fill event with comprehensive logging"""
@@ -234,7 +371,7 @@ class LiveGoldBot(BaseGoldBot):
             position = self.positions[order_id]
             expected_price = position.get('expected_entry', position.get('entry_price'))
             actual_slippage = fill_price - expected_price if side == 'BUY' else expected_price - fill_price
-            slippage_cost = abs(actual_slippage) * quantity * self.config.TICK_VALUE / self.config.TICK_SIZE
+            slippage_cost = abs(actual_slippage) * quantity * self._point_value
             
             # Update position with fill data
             position['status'] = 'filled'
@@ -245,7 +382,7 @@ class LiveGoldBot(BaseGoldBot):
             
             # Recalculate risk with actual fill price
             actual_stop_distance = abs(fill_price - position['stop_price'])
-            actual_risk = actual_stop_distance * quantity * self.config.TICK_VALUE / self.config.TICK_SIZE
+            actual_risk = actual_stop_distance * quantity * self._point_value
             position['actual_risk'] = actual_risk
             
             logger.info("-" * 60)
@@ -350,25 +487,24 @@ class LiveGoldBot(BaseGoldBot):
         self.daily_pnl = unrealized_pnl + realized_pnl
         
         # Check risk limits
-        if self.daily_pnl <= -self.config.DAILY_LOSS_LIMIT:
+        if self.daily_pnl <= self._loss_threshold:
             logger.critical(f"Daily loss limit reached: ${self.daily_pnl:.2f}")
             await self.flatten_all_positions()
     
+    def get_active_contract(self) -> str:
+        """Get the active contract symbol, resolved at most once per UTC day"""
+        today = (self._tick_now or datetime.now(timezone.utc)).date()
+        if self._active_contract_date != today:
+            self._active_contract_symbol = self.config.get_active_contract()
+            self._active_contract_date = today
+        return self._active_contract_symbol
+    
     async def get_multi_timeframe_candles(self, symbol: str) -> Dict[str, pd.DataFrame]:
         """Get candles for all analysis timeframes"""
         mtf_data = {}
         
-        # Use 400 candles for all timeframes for better pattern detection
-        timeframe_limits = {
-            '1m': 400,   # 6.7 hours of data
-            '5m': 400,   # 33.3 hours of data
-            '15m': 400,  # 100 hours (4.2 days) of data
-            '30m': 400,  # 200 hours (8.3 days) of data
-            '1h': 400    # 400 hours (16.7 days) of data
-        }
-        
         for tf in self.config.ANALYSIS_TIMEFRAMES:
-            limit = timeframe_limits.get(tf, self.config.LOOKBACK_CANDLES)
+            limit = _TIMEFRAME_LIMITS.get(tf, self.config.LOOKBACK_CANDLES)
             candles = await self.get_candles(symbol, tf, limit)
             if not candles.empty:
                 mtf_data[tf] = candles
@@ -378,20 +514,26 @@ class LiveGoldBot(BaseGoldBot):
         
         return mtf_data
     
+    def _candle_cache_expiry(self, key: Tuple[str, str, int], value: pd.DataFrame, now: float) -> float:
+        """Expiry time for a cached candle set: the next bar close for its timeframe, or MAX_AGE if sooner"""
+        expires = now + self.config.CANDLE_CACHE_MAX_AGE
+        bar_seconds = self.config.CANDLE_BAR_SECONDS.get(key[1])
+        if bar_seconds:
+            next_close = (now // bar_seconds + 1) * bar_seconds
+            expires = min(expires, next_close)
+        return expires
+    
     async def get_candles(self, symbol: str, timeframe: str, limit: int = 100) -> pd.DataFrame:
         """Get official exchange candles from REST API for pattern detection"""
         try:
             # Always use REST API for accurate exchange candles
             # WebSocket is only for real-time price monitoring, not candle building
             
-            # Check cache first
-            cache_key = f"{symbol}_{timeframe}_{limit}"
-            now = datetime.now(timezone.utc)
-            
-            if cache_key in self.candle_cache:
-                cached_data, cache_time = self.candle_cache[cache_key]
-                if (now - cache_time).seconds < 60:  # 1 minute cache
-                    return cached_data
+            # Check cache first (entries expire per timeframe)
+            cache_key = (symbol, timeframe, limit)
+            cached_data = self.candle_cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
             
             # Fetch from API
             candles_data = await self.api_client.get_historical_data(
@@ -404,31 +546,22 @@ class LiveGoldBot(BaseGoldBot):
                 logger.error("No candle data received")
                 return pd.DataFrame()
             
-            # Convert to DataFrame
-            df = pd.DataFrame(candles_data)
-            
-            # Rename columns to match expected format
+            # Convert to DataFrame, building typed columns directly
             # TopStep API returns 't', 'o', 'h', 'l', 'c', 'v'
-            column_mapping = {
-                't': 'timestamp',
-                'o': 'open',  
-                'h': 'high',
-                'l': 'low',
-                'c': 'close',
-                'v': 'volume'
+            count = len(candles_data)
+            columns = {
+                # Timestamps are already in ISO format from the API
+                'timestamp': pd.to_datetime([c['t'] for c in candles_data], utc=True, format='ISO8601')
             }
-            
-            # Apply the mapping
-            df = df.rename(columns=column_mapping)
-            
-            # Convert timestamp (already in ISO format from API)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+            for key, name in _CANDLE_FIELDS:
+                columns[name] = np.fromiter((c[key] for c in candles_data), dtype=np.float64, count=count)
+            df = pd.DataFrame(columns, copy=False)
             
             # Validate data
             df = self.validator.validate_candles_df(df)
             
             # Cache the result
-            self.candle_cache[cache_key] = (df, now)
+            self.candle_cache[cache_key] = df
             
             return df
             
@@ -445,14 +578,22 @@ class LiveGoldBot(BaseGoldBot):
             # Timestamp for trade entry
             entry_timestamp = datetime.now(timezone.utc)
             
-            # Use real-time price if available, otherwise get from API
-            if self.current_price > 0:
+            # Config values used throughout the order path
+            cfg = self.config
+            symbol = cfg.SYMBOL
+            tick_size = cfg.TICK_SIZE
+            tick_value = cfg.TICK_VALUE
+            max_risk = cfg.MAX_RISK_PER_TRADE
+            
+            # Use real-time price if it is recent, otherwise get from API
+            if self._has_fresh_quote():
                 current_price = self.current_price
                 price_source = "WebSocket"
+                market_data = None
                 logger.info(f"Using real-time WebSocket price: ${current_price:.2f}")
             else:
                 # Fallback to REST API
-                market_data = await self.api_client.get_market_data(self.config.SYMBOL)
+                market_data = await self.api_client.get_market_data(symbol)
                 if not market_data:
                     logger.error("Cannot get current market price")
                     return False
@@ -465,27 +606,25 @@ class LiveGoldBot(BaseGoldBot):
             
             # Calculate all trade metrics
             stop_distance = abs(current_price - stop_price)
-            stop_distance_ticks = stop_distance / self.config.TICK_SIZE
+            stop_distance_ticks = stop_distance / tick_size
             target_distance = abs(target_price - current_price)
-            target_distance_ticks = target_distance / self.config.TICK_SIZE
+            target_distance_ticks = target_distance / tick_size
             
             # Risk calculations
-            risk_per_contract = stop_distance_ticks * self.config.TICK_VALUE
+            risk_per_contract = stop_distance_ticks * tick_value
             total_risk = risk_per_contract * quantity
             
             # Reward calculations
-            reward_per_contract = target_distance_ticks * self.config.TICK_VALUE
+            reward_per_contract = target_distance_ticks * tick_value
             total_reward = reward_per_contract * quantity
             
             # Risk:Reward ratio
             risk_reward_ratio = target_distance / stop_distance if stop_distance > 0 else 0
             
-            # Expected entry price (for market orders, expect some slippage)
-            expected_entry = current_price
-            if side.upper() == 'BUY':
-                expected_entry = ask_price if 'ask_price' in locals() else current_price
-            else:
-                expected_entry = bid_price if 'bid_price' in locals() else current_price
+            # Expected entry price (for market orders, expect some slippage):
+            # buys fill at the ask, sells at the bid
+            side_str, price_key = _ORDER_SIDES[side.upper()]
+            expected_entry = market_data[price_key] if market_data else current_price
             
             # Log comprehensive trade details
             logger.info("=" * 60)
@@ -493,7 +632,7 @@ class LiveGoldBot(BaseGoldBot):
             logger.info("=" * 60)
             logger.info(f"🕐 Entry Timestamp: {entry_timestamp.isoformat()}")
             logger.info(f"📈 Trade Direction: {side.upper()}")
-            logger.info(f"🎯 Symbol: {self.config.SYMBOL} ({self.config.get_active_contract()})")
+            logger.info(f"🎯 Symbol: {symbol} ({self.get_active_contract()})")
             logger.info(f"📊 Position Size: {quantity} contracts")
             logger.info("-" * 60)
             logger.info("💰 PRICE LEVELS:")
@@ -507,27 +646,27 @@ class LiveGoldBot(BaseGoldBot):
             logger.info(f"   Reward per Contract: ${reward_per_contract:.2f}")
             logger.info(f"   Total Reward: ${total_reward:.2f}")
             logger.info(f"   Risk:Reward Ratio: 1:{risk_reward_ratio:.2f}")
-            logger.info(f"   Risk % of Daily Limit: {(total_risk/self.config.DAILY_LOSS_LIMIT)*100:.1f}%")
+            logger.info(f"   Risk % of Daily Limit: {(total_risk/cfg.DAILY_LOSS_LIMIT)*100:.1f}%")
             logger.info("-" * 60)
             logger.info("📈 POSITION SIZING:")
             logger.info(f"   Account Balance: ${await self.get_account_balance():.2f}")
-            logger.info(f"   Risk per Trade: ${self.config.MAX_RISK_PER_TRADE:.2f}")
+            logger.info(f"   Risk per Trade: ${max_risk:.2f}")
             logger.info(f"   Notional Value: ${expected_entry * quantity:.2f}")
             logger.info("=" * 60)
             
             # Get contract ID for current symbol
             contract_id = None
-            if hasattr(self, 'contract_id') and self.contract_id:
+            if self.contract_id:
                 contract_id = self.contract_id  # Use the contract ID we got during connection
             else:
                 # Fallback: get contract ID if we don't have it
-                contract = await self.api_client._get_contract_by_symbol(self.config.SYMBOL)
+                contract = await self.api_client._get_contract_by_symbol(symbol)
                 if contract:
                     contract_id = contract.get('id')
                     self.contract_id = contract_id  # Store for future use
             
             if not contract_id:
-                logger.error(f"Cannot find contract ID for {self.config.SYMBOL}")
+                logger.error(f"Cannot find contract ID for {symbol}")
                 return False
             
             # Prepare order data
@@ -535,43 +674,43 @@ class LiveGoldBot(BaseGoldBot):
             # This approach is more reliable than trying to attach them to the market order
             
             order_data = {
-                "symbol": self.config.SYMBOL,
+                "symbol": symbol,
                 "contractId": contract_id,
-                "side": side.capitalize(),  # "Buy" or "Sell"
+                "side": side_str,  # "Buy" or "Sell"
                 "quantity": quantity,
                 "orderType": "Market",  # TopStep expects capitalized
                 "time_in_force": "GTC",
-                "account_id": self.config.TOPSTEP_ACCOUNT_ID
+                "account_id": cfg.TOPSTEP_ACCOUNT_ID
             }
             
             # NOTE: We do NOT include stopPrice or limitPrice on the market order
             # These will be placed as separate protective orders after the fill
             
             # Risk check
-            if total_risk > self.config.MAX_RISK_PER_TRADE:
-                logger.error(f"❌ TRADE REJECTED: Risk too high: ${total_risk:.2f} > ${self.config.MAX_RISK_PER_TRADE}")
+            if total_risk > max_risk:
+                logger.error(f"❌ TRADE REJECTED: Risk too high: ${total_risk:.2f} > ${max_risk}")
                 return False
             
             # Determine which account to use
-            if self.config.PAPER_TRADING:
+            if cfg.PAPER_TRADING:
                 logger.info("📋 PLACING ORDER TO PRACTICE ACCOUNT")
                 account_mode = "PRACTICE"
                 # Use practice account ID explicitly
-                order_data['account_id'] = self.config.PRACTICE_ACCOUNT_ID
+                order_data['account_id'] = cfg.PRACTICE_ACCOUNT_ID
             else:
                 logger.info("💹 PLACING ORDER TO EVALUATION ACCOUNT")
                 account_mode = "EVALUATION"
                 # Use step1 account ID
-                order_data['account_id'] = self.config.STEP1_ACCOUNT_ID
+                order_data['account_id'] = cfg.STEP1_ACCOUNT_ID
             
             # Submit order to TopStep API
             logger.info(f"📤 SUBMITTING ORDER TO TOPSTEP ({account_mode} ACCOUNT)")
-            order_start_time = datetime.now(timezone.utc)
+            order_start = time.perf_counter()
             
             result = await self.api_client.place_order(order_data)
             
+            execution_time = time.perf_counter() - order_start
             order_end_time = datetime.now(timezone.utc)
-            execution_time = (order_end_time - order_start_time).total_seconds()
             
             if result:
                 order_id = result.get('order_id')
@@ -598,7 +737,7 @@ class LiveGoldBot(BaseGoldBot):
                     'target_distance_ticks': target_distance_ticks,
                     'price_source': price_source,
                     'slippage': slippage,
-                    'slippage_cost': abs(slippage) * quantity * self.config.TICK_VALUE / self.config.TICK_SIZE
+                    'slippage_cost': abs(slippage) * quantity * self._point_value
                 }
                 
                 self.positions[order_id] = position_data
@@ -608,7 +747,7 @@ class LiveGoldBot(BaseGoldBot):
                 logger.info(f"✅ ORDER FILLED ON {account_mode} ACCOUNT:")
                 logger.info(f"   Order ID: {order_id}")
                 logger.info(f"   Fill Price: ${fill_price:.2f}")
-                logger.info(f"   Slippage: ${slippage:.2f} ({slippage/self.config.TICK_SIZE:.1f} ticks)")
+                logger.info(f"   Slippage: ${slippage:.2f} ({slippage/tick_size:.1f} ticks)")
                 logger.info(f"   Slippage Cost: ${position_data['slippage_cost']:.2f}")
                 logger.info(f"   Execution Time: {execution_time:.3f} seconds")
                 logger.info("=" * 60)
@@ -620,17 +759,17 @@ class LiveGoldBot(BaseGoldBot):
                 self.total_trades += 1
                 
                 # Create managed position with partial targets if enabled
-                if self.config.ENABLE_PARTIAL_PROFITS and self.partial_profit_manager:
+                if cfg.ENABLE_PARTIAL_PROFITS and self.partial_profit_manager:
                     logger.info("Creating partial profit targets...")
                     await self.partial_profit_manager.create_managed_position(
                         order_id=order_id,
                         side=side,
-                        quantity=position_size,
+                        quantity=quantity,
                         entry_price=fill_price,
                         stop_price=stop_price,
                         contract_id=contract_id,
-                        custom_percentages=self.config.PARTIAL_PROFIT_PERCENTAGES,
-                        custom_ratios=self.config.PARTIAL_PROFIT_RATIOS
+                        custom_percentages=cfg.PARTIAL_PROFIT_PERCENTAGES,
+                        custom_ratios=cfg.PARTIAL_PROFIT_RATIOS
                     )
                 
                 return True
@@ -679,82 +818,105 @@ class LiveGoldBot(BaseGoldBot):
     def generate_daily_summary(self) -> None:
         """Generate daily trading summary with detailed metrics"""
         try:
-            logger.info("=" * 80)
-            logger.info("                    ▓▓▓▓▓▓  ▓▓      ▓▓   ▓▓ ▓▓▓▓▓▓▓     ▓▓▓▓▓  ")
-            logger.info("                    ▓▓   ▓▓ ▓▓      ▓▓   ▓▓ ▓▓            ▓▓ ▓▓ ")
-            logger.info("                    ▓▓▓▓▓▓  ▓▓      ▓▓   ▓▓ ▓▓▓▓▓        ▓▓▓▓▓  ")
-            logger.info("                    ▓▓   ▓▓ ▓▓      ▓▓   ▓▓ ▓▓          ▓▓   ▓▓ ")
-            logger.info("                    ▓▓▓▓▓▓  ▓▓▓▓▓▓▓ ▓▓▓▓▓▓  ▓▓▓▓▓▓▓    ▓▓▓▓▓▓  ")
-            logger.info("")
-            logger.info("📊 DAILY TRADING SUMMARY")
-            logger.info("=" * 80)
-            logger.info(f"Date: {datetime.now(timezone.utc).date()}")
-            logger.info(f"Trading Mode: {'PAPER' if self.config.PAPER_TRADING else 'LIVE'}")
-            logger.info(f"Contract: {self.config.SYMBOL} ({self.config.get_active_contract()})")
-            logger.info("-" * 80)
+            # Build the whole summary first and emit it as a single log record
+            lines = [
+                "=" * 80,
+                "                    ▓▓▓▓▓▓  ▓▓      ▓▓   ▓▓ ▓▓▓▓▓▓▓     ▓▓▓▓▓  ",
+                "                    ▓▓   ▓▓ ▓▓      ▓▓   ▓▓ ▓▓            ▓▓ ▓▓ ",
+                "                    ▓▓▓▓▓▓  ▓▓      ▓▓   ▓▓ ▓▓▓▓▓        ▓▓▓▓▓  ",
+                "                    ▓▓   ▓▓ ▓▓      ▓▓   ▓▓ ▓▓          ▓▓   ▓▓ ",
+                "                    ▓▓▓▓▓▓  ▓▓▓▓▓▓▓ ▓▓▓▓▓▓  ▓▓▓▓▓▓▓    ▓▓▓▓▓▓  ",
+                "",
+                "📊 DAILY TRADING SUMMARY",
+                "=" * 80,
+                f"Date: {datetime.now(timezone.utc).date()}",
+                f"Trading Mode: {'PAPER' if self.config.PAPER_TRADING else 'LIVE'}",
+                f"Contract: {self.config.SYMBOL} ({self.get_active_contract()})",
+                "-" * 80,
+            ]
             
             # Performance metrics
             total_trades = self.total_trades
-            winners = getattr(self, 'winning_trades', 0)
-            losers = getattr(self, 'losing_trades', 0)
+            winners = self.winning_trades
+            losers = self.losing_trades
             win_rate = (winners / total_trades * 100) if total_trades > 0 else 0
             
-            logger.info("PERFORMANCE METRICS:")
-            logger.info(f"   Total Trades: {total_trades}")
-            logger.info(f"   Winners: {winners}")
-            logger.info(f"   Losers: {losers}")
-            logger.info(f"   Win Rate: {win_rate:.1f}%")
-            logger.info(f"   Daily P&L: ${self.daily_pnl:.2f}")
-            logger.info(f"   Consecutive Losses: {self.consecutive_losses}")
-            logger.info("-" * 80)
+            lines.extend([
+                "PERFORMANCE METRICS:",
+                f"   Total Trades: {total_trades}",
+                f"   Winners: {winners}",
+                f"   Losers: {losers}",
+                f"   Win Rate: {win_rate:.1f}%",
+                f"   Daily P&L: ${self.daily_pnl:.2f}",
+                f"   Consecutive Losses: {self.consecutive_losses}",
+                "-" * 80,
+            ])
             
             # Pattern analysis
-            logger.info("PATTERN ANALYSIS:")
-            logger.info(f"   Patterns Found: {getattr(self, 'patterns_found_today', 0)}")
-            logger.info(f"   High Quality Patterns: {getattr(self, 'high_quality_patterns_today', 0)}")
-            logger.info("-" * 80)
+            lines.extend([
+                "PATTERN ANALYSIS:",
+                f"   Patterns Found: {self.patterns_found_today}",
+                f"   High Quality Patterns: {self.high_quality_patterns_today}",
+                "-" * 80,
+            ])
             
             # Risk metrics
             remaining_risk = self.config.DAILY_LOSS_LIMIT + self.daily_pnl
-            logger.info("RISK METRICS:")
-            logger.info(f"   Daily Loss Limit: ${self.config.DAILY_LOSS_LIMIT:.2f}")
-            logger.info(f"   Remaining Risk: ${remaining_risk:.2f}")
-            logger.info(f"   Risk Used: {(-self.daily_pnl/self.config.DAILY_LOSS_LIMIT*100):.1f}%" if self.daily_pnl < 0 else "   Risk Used: 0.0%")
-            logger.info("-" * 80)
+            lines.extend([
+                "RISK METRICS:",
+                f"   Daily Loss Limit: ${self.config.DAILY_LOSS_LIMIT:.2f}",
+                f"   Remaining Risk: ${remaining_risk:.2f}",
+                f"   Risk Used: {(-self.daily_pnl/self.config.DAILY_LOSS_LIMIT*100):.1f}%" if self.daily_pnl < 0 else "   Risk Used: 0.0%",
+                "-" * 80,
+            ])
             
             # Trade history analysis
-            if hasattr(self, 'trade_history') and self.trade_history:
-                # Calculate average metrics
-                total_risk = sum(t.get('risk_amount', 0) for t in self.trade_history)
-                total_slippage = sum(abs(t.get('slippage', 0)) for t in self.trade_history if t.get('status') == 'filled')
-                avg_risk = total_risk / len(self.trade_history) if self.trade_history else 0
-                avg_slippage = total_slippage / len([t for t in self.trade_history if t.get('status') == 'filled']) if any(t.get('status') == 'filled' for t in self.trade_history) else 0
+            if self.trade_history:
+                # Calculate average metrics and collect R-multiples in a single pass
+                total_risk = 0
+                total_slippage = 0
+                filled_count = 0
+                r_multiples = []  # R-Multiple analysis for closed trades
+                for t in self.trade_history:
+                    total_risk += t.get('risk_amount', 0)
+                    status = t.get('status')
+                    if status == 'filled':
+                        total_slippage += abs(t.get('slippage', 0))
+                        filled_count += 1
+                    elif status == 'closed':
+                        r_multiples.append(t.get('r_multiple', 0))
                 
-                # R-Multiple analysis for closed trades
-                closed_trades = [t for t in self.trade_history if t.get('status') == 'closed']
-                if closed_trades:
-                    r_multiples = [t.get('r_multiple', 0) for t in closed_trades]
-                    avg_r = sum(r_multiples) / len(r_multiples) if r_multiples else 0
-                    max_r = max(r_multiples) if r_multiples else 0
-                    min_r = min(r_multiples) if r_multiples else 0
+                avg_risk = total_risk / len(self.trade_history)
+                avg_slippage = total_slippage / filled_count if filled_count else 0
+                
+                if r_multiples:
+                    avg_r = sum(r_multiples) / len(r_multiples)
+                    max_r = max(r_multiples)
+                    min_r = min(r_multiples)
                     
-                    logger.info("TRADE STATISTICS:")
-                    logger.info(f"   Average Risk per Trade: ${avg_risk:.2f}")
-                    logger.info(f"   Average Slippage: ${avg_slippage:.2f}")
-                    logger.info(f"   Average R-Multiple: {avg_r:.2f}R")
-                    logger.info(f"   Best Trade: {max_r:.2f}R")
-                    logger.info(f"   Worst Trade: {min_r:.2f}R")
-                    logger.info("-" * 80)
+                    lines.extend([
+                        "TRADE STATISTICS:",
+                        f"   Average Risk per Trade: ${avg_risk:.2f}",
+                        f"   Average Slippage: ${avg_slippage:.2f}",
+                        f"   Average R-Multiple: {avg_r:.2f}R",
+                        f"   Best Trade: {max_r:.2f}R",
+                        f"   Worst Trade: {min_r:.2f}R",
+                        "-" * 80,
+                    ])
             
             # Market conditions
-            if hasattr(self, 'tick_count') and self.tick_count > 0:
-                logger.info("MARKET CONDITIONS:")
-                logger.info(f"   WebSocket Ticks Received: {self.tick_count}")
-                logger.info(f"   Current Price: ${self.current_price:.2f}")
-                if hasattr(self, 'last_tick_time') and self.last_tick_time:
-                    logger.info(f"   Last Tick: {self.last_tick_time.isoformat()}")
-            
-            logger.info("=" * 80)
+            if self.tick_count > 0:
+                lines.extend([
+                    "MARKET CONDITIONS:",
+                    f"   WebSocket Ticks Received: {self.tick_count}",
+                    f"   Ticks Dropped (backpressure): {self._dropped_ticks}",
+                    f"   Current Price: ${self.current_price:.2f}",
+                ])
+                if self.last_tick_time:
+                    lines.append(f"   Last Tick: {self.last_tick_time.isoformat()}")
+            
+            lines.append("=" * 80)
+            logger.info("\n".join(lines))
             
         except Exception as e:
             logger.error(f"Error generating daily summary: {e}")
@@ -932,70 +1094,110 @@ class LiveGoldBot(BaseGoldBot):
             logger.warning("Flattening all positions")
             
             positions = await self.api_client.get_positions()
+            symbol = self._symbol
+            positions = [p for p in positions if p['symbol'] == symbol]
+            
+            # Close all positions concurrently, bounded to respect broker rate limits
+            semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_ORDERS)
+            
+            async def close_position(position: Dict):
+                # Place opposite order to close
+                close_side = 'SELL' if position['side'] == 'BUY' else 'BUY'
+                close_order = {
+                    "symbol": symbol,
+                    "side": close_side,
+                    "quantity": abs(position['quantity']),
+                    "order_type": "MARKET",
+                    "time_in_force": "IOC",
+                    "account_id": self.config.TOPSTEP_ACCOUNT_ID
+                }
+                async with semaphore:
+                    return await self.api_client.place_order(close_order)
             
-            for position in positions:
-                if position['symbol'] == self.config.SYMBOL:
-                    # Place opposite order to close
-                    close_side = 'SELL' if position['side'] == 'BUY' else 'BUY'
-                    close_order = {
-                        "symbol": self.config.SYMBOL,
-                        "side": close_side,
-                        "quantity": abs(position['quantity']),
-                        "order_type": "MARKET",
-                        "time_in_force": "IOC",
-                        "account_id": self.config.TOPSTEP_ACCOUNT_ID
-                    }
-                    
-                    result = await self.api_client.place_order(close_order)
-                    if result:
-                        logger.info(f"Closed position: {position['position_id']}")
-                    else:
-                        logger.error(f"Failed to close position: {position['position_id']}")
+            results = await asyncio.gather(
+                *(close_position(position) for position in positions),
+                return_exceptions=True
+            )
+            
+            for position, result in zip(positions, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to close position: {position['position_id']} ({result})")
+                elif result:
+                    logger.info(f"Closed position: {position['position_id']}")
+                else:
+                    logger.error(f"Failed to close position: {position['position_id']}")
                         
         except Exception as e:
             logger.error(f"Error flattening positions: {e}")
     
-    def find_mtf_order_blocks(self, mtf_data: Dict[str, pd.DataFrame]) -> Dict[str, List[Dict]]:
-        """Find order blocks across multiple timeframes"""
-        mtf_patterns = {}
+    async def find_mtf_order_blocks(self, mtf_data: Dict[str, pd.DataFrame]) -> Tuple[Dict[str, List[Dict]], int]:
+        """Find order blocks across multiple timeframes concurrently
+        
+        Returns:
+            Tuple of (patterns keyed by timeframe, total pattern count)
+        """
+        # Timeframes are independent, so scan them in worker threads
+        timeframes = list(mtf_data)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, self.find_order_blocks, mtf_data[tf]) for tf in timeframes
+        ))
         
-        for timeframe, candles in mtf_data.items():
-            patterns = self.find_order_blocks(candles)
-            mtf_patterns[timeframe] = patterns
-            logger.debug(f"Found {len(patterns)} patterns on {timeframe}")
+        mtf_patterns = dict(zip(timeframes, results))
+        total_patterns = 0
+        for timeframe, patterns in mtf_patterns.items():
+            count = len(patterns)
+            total_patterns += count
+            logger.debug(f"Found {count} patterns on {timeframe}")
         
-        return mtf_patterns
+        return mtf_patterns, total_patterns
+    
+    def _get_pattern_levels(self, mtf_patterns: Dict[str, List[Dict]]) -> Dict[tuple, np.ndarray]:
+        """Pattern levels per (timeframe, type), built once per set of MTF patterns"""
+        if self._pattern_levels_source is not mtf_patterns:
+            self._pattern_levels = {
+                (tf, pattern_type): np.fromiter(
+                    (p['level'] for p in patterns if p['type'] == pattern_type), dtype=np.float64
+                )
+                for tf, patterns in mtf_patterns.items()
+                for pattern_type in ('bullish', 'bearish')
+            }
+            self._pattern_levels_source = mtf_patterns
+        return self._pattern_levels
     
-    def calculate_mtf_pattern_score(self, pattern: Dict, timeframe: str, mtf_data: Dict[str, pd.DataFrame], mtf_patterns: Dict[str, List[Dict]]) -> float:
-        """Calculate multi-timeframe pattern score"""
+    def calculate_mtf_pattern_score(self, pattern: Dict, timeframe: str, mtf_data: Dict[str, pd.DataFrame],
+                                    mtf_patterns: Dict[str, List[Dict]], base_score: Optional[float] = None) -> float:
+        """Calculate multi-timeframe pattern score
+        
+        `base_score` is the pattern's own-timeframe score if already computed
+        (see calculate_pattern_scores_batch).
+        """
         # Get base score from primary timeframe
-        base_score = self.calculate_pattern_score(pattern, mtf_data[timeframe])
+        if base_score is None:
+            base_score = self.calculate_pattern_score(
+                pattern, mtf_data[timeframe], self._get_avg_volumes(mtf_data)[timeframe]
+            )
         
         # Multi-timeframe confluence bonus
         mtf_bonus = 0
-        timeframe_weights = {
-            '1m': 0.2,   # Entry timeframe
-            '5m': 0.5,   # Primary timeframe  
-            '15m': 0.3   # Higher timeframe
-        }
         
         # Check for confluence on other timeframes
         pattern_type = pattern['type']
         pattern_level = pattern['level']
         
-        for tf, patterns in mtf_patterns.items():
+        levels_by_tf_type = self._get_pattern_levels(mtf_patterns)
+        
+        for tf in mtf_patterns:
             if tf == timeframe:
                 continue
                 
-            # Look for similar patterns on other timeframes
-            for other_pattern in patterns:
-                if other_pattern['type'] == pattern_type:
-                    # Check if levels are close (within 0.5%)
-                    level_diff = abs(other_pattern['level'] - pattern_level) / pattern_level
-                    if level_diff < 0.005:
-                        weight = timeframe_weights.get(tf, 0.2)
-                        mtf_bonus += 2 * weight
-                        logger.debug(f"Found confluence on {tf} timeframe, bonus: {2 * weight}")
+            # Look for similar patterns on other timeframes (levels within 0.5%)
+            levels = levels_by_tf_type[(tf, pattern_type)]
+            matches = np.count_nonzero(np.abs(levels - pattern_level) / pattern_level < 0.005)
+            if matches:
+                weight = _TF_WEIGHTS.get(tf, 0.2)
+                mtf_bonus += 2 * weight * matches
+                logger.debug(f"Found {matches} confluence(s) on {tf} timeframe, bonus: {2 * weight * matches}")
         
         # Trend alignment bonus
         trend_bonus = self.calculate_trend_alignment(pattern, mtf_data)
@@ -1006,23 +1208,40 @@ class LiveGoldBot(BaseGoldBot):
         # Cap at 10
         return min(total_score, 10)
     
+    def _get_avg_volumes(self, mtf_data: Dict[str, pd.DataFrame]) -> Dict[str, np.ndarray]:
+        """Rolling average volume per timeframe, computed once per set of MTF candles"""
+        if self._avg_volumes_source is not mtf_data:
+            self._avg_volumes = {tf: self._rolling_avg_volume(candles) for tf, candles in mtf_data.items()}
+            self._avg_volumes_source = mtf_data
+        return self._avg_volumes
+    
+    def _get_timeframe_trends(self, mtf_data: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+        """Trend direction per timeframe, computed once per set of MTF candles"""
+        if self._timeframe_trends_source is not mtf_data:
+            trends = {}
+            for timeframe, candles in mtf_data.items():
+                if len(candles) < 20:
+                    continue
+                
+                # Simple trend detection using EMAs
+                close = candles['close']
+                ema_fast = close.ewm(span=8, adjust=False).mean()
+                ema_slow = close.ewm(span=21, adjust=False).mean()
+                trends[timeframe] = 'bullish' if ema_fast.iloc[-1] > ema_slow.iloc[-1] else 'bearish'
+            
+            self._timeframe_trends = trends
+            self._timeframe_trends_source = mtf_data
+        return self._timeframe_trends
+    
     def calculate_trend_alignment(self, pattern: Dict, mtf_data: Dict[str, pd.DataFrame]) -> float:
         """Calculate trend alignment across timeframes"""
         trend_scores = []
+        pattern_type = pattern['type']
         
-        for timeframe, candles in mtf_data.items():
-            if len(candles) < 20:
-                continue
-                
-            # Simple trend detection using EMAs
-            ema_fast = candles['close'].ewm(span=8, adjust=False).mean()
-            ema_slow = candles['close'].ewm(span=21, adjust=False).mean()
-            
-            current_trend = 'bullish' if ema_fast.iloc[-1] > ema_slow.iloc[-1] else 'bearish'
-            
+        for timeframe, current_trend in self._get_timeframe_trends(mtf_data).items():
             # Check if pattern aligns with trend
-            if pattern['type'] == current_trend:
-                weight = {'1m': 0.3, '5m': 0.5, '15m': 0.7}.get(timeframe, 0.3)
+            if pattern_type == current_trend:
+                weight = _TREND_WEIGHTS.get(timeframe, 0.3)
                 trend_scores.append(weight)
         
         return sum(trend_scores)
@@ -1034,16 +1253,23 @@ class LiveGoldBot(BaseGoldBot):
         signal_cooldown = getattr(self.config, 'SIGNAL_COOLDOWN_SECONDS', 300)
         main_loop_delay = getattr(self.config, 'MAIN_LOOP_DELAY_SECONDS', 30)
         
+        # Monitoring runs on its own wall-clock cadence, independent of bar wake-ups
+        next_monitoring_update = 0.0
+        
         while self.is_running:
             try:
-                # Check if we can trade
-                if not self.can_trade():
+                # Sample the clock once for this iteration
+                self._tick_now = datetime.now(timezone.utc)
+                
+                # Check if we can trade (evaluated once per iteration)
+                can_trade_now = self.can_trade()
+                if not can_trade_now:
                     await asyncio.sleep(60)
                     continue
                 
                 # Get multi-timeframe market data
                 mtf_data = await self.get_multi_timeframe_candles(
-                    self.config.get_active_contract()
+                    self.get_active_contract()
                 )
                 
                 if not mtf_data or self.config.PRIMARY_TIMEFRAME not in mtf_data:
@@ -1052,10 +1278,7 @@ class LiveGoldBot(BaseGoldBot):
                     continue
                 
                 # Find patterns across all timeframes
-                mtf_patterns = self.find_mtf_order_blocks(mtf_data)
-                
-                # Count total patterns
-                total_patterns = sum(len(patterns) for patterns in mtf_patterns.values())
+                mtf_patterns, total_patterns = await self.find_mtf_order_blocks(mtf_data)
                 self.patterns_found_today = total_patterns
                 
                 # Score patterns with multi-timeframe analysis
@@ -1064,17 +1287,36 @@ class LiveGoldBot(BaseGoldBot):
                 best_timeframe = None
                 high_quality_count = 0
                 
-                # Analyze patterns from all timeframes
-                for timeframe, patterns in mtf_patterns.items():
-                    for pattern in patterns:
-                        score = self.calculate_mtf_pattern_score(pattern, timeframe, mtf_data, mtf_patterns)
-                        
-                        if score >= self.config.MIN_PATTERN_SCORE:
-                            high_quality_count += 1
-                            if score > best_score:
-                                best_signal = pattern
-                                best_score = score
-                                best_timeframe = timeframe
+                # Base scores for each timeframe's patterns in one pass
+                avg_volumes = self._get_avg_volumes(mtf_data)
+                base_scores = {
+                    timeframe: self.calculate_pattern_scores_batch(patterns, mtf_data[timeframe], avg_volumes[timeframe])
+                    for timeframe, patterns in mtf_patterns.items()
+                }
+                
+                # Analyze patterns from all timeframes, highest base score first
+                # (ties keep timeframe/pattern order) so a capped score is usually reached early
+                candidates = sorted(
+                    ((timeframe, pattern, base_scores[timeframe][k])
+                     for timeframe, patterns in mtf_patterns.items() for k, pattern in enumerate(patterns)),
+                    key=lambda item: item[2],
+                    reverse=True
+                )
+                for timeframe, pattern, base_score in candidates:
+                    # Once the best score is capped nothing can replace it; MTF bonuses are
+                    # never negative, so a base score at the threshold is high quality as is
+                    if best_score >= _MAX_PATTERN_SCORE and base_score >= self.config.MIN_PATTERN_SCORE:
+                        high_quality_count += 1
+                        continue
+                    
+                    score = self.calculate_mtf_pattern_score(pattern, timeframe, mtf_data, mtf_patterns, float(base_score))
+                    
+                    if score >= self.config.MIN_PATTERN_SCORE:
+                        high_quality_count += 1
+                        if score > best_score:
+                            best_signal = pattern
+                            best_score = score
+                            best_timeframe = timeframe
                 
                 # Update high quality pattern count
                 self.high_quality_patterns_today = high_quality_count
@@ -1082,7 +1324,7 @@ class LiveGoldBot(BaseGoldBot):
                 # Execute best signal if found
                 if best_signal:
                     logger.info(f"Best signal found on {best_timeframe} timeframe with score {best_score:.1f}")
-                    self.last_signal_time = datetime.now(timezone.utc)
+                    self.last_signal_time = self._tick_now
                     
                     # Use primary timeframe candles for execution
                     primary_candles = mtf_data[self.config.PRIMARY_TIMEFRAME]
@@ -1090,12 +1332,24 @@ class LiveGoldBot(BaseGoldBot):
                     
                     # Wait before looking for next signal
                     await asyncio.sleep(signal_cooldown)
+                    
+                    # State may have changed during the cooldown
+                    self._tick_now = datetime.now(timezone.utc)
+                    can_trade_now = self.can_trade()
                 
-                # Update monitoring
-                await self.update_monitoring()
+                # Update monitoring (immediately after a trade, otherwise on its interval)
+                now_mono = time.monotonic()
+                if best_signal or now_mono >= next_monitoring_update:
+                    await self.update_monitoring(can_trade=can_trade_now)
+                    next_monitoring_update = now_mono + self.config.MONITORING_UPDATE_INTERVAL
                 
-                # Wait before next iteration
-                await asyncio.sleep(main_loop_delay)
+                # Wait for the next bar close, or the loop delay at most
+                try:
+                    await asyncio.wait_for(self._new_bar_event.wait(), timeout=main_loop_delay)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._new_bar_event.clear()
                 
             except Exception as e:
                 logger.error(f"Error in trading loop: {e}")
@@ -1104,14 +1358,16 @@ class LiveGoldBot(BaseGoldBot):
     async def get_account_balance(self) -> float:
         """Get current account balance, with caching"""
         try:
+            now = self._tick_now or datetime.now(timezone.utc)
+            
             # Check if we need to refresh the balance (every 5 minutes)
             if self._balance_last_fetched is None or \
-               (datetime.now() - self._balance_last_fetched).seconds > 300:
+               (now - self._balance_last_fetched).total_seconds() > 300:
                 
                 account_info = await self.api_client.get_account_info()
                 if account_info and 'balance' in account_info:
                     self._account_balance = account_info['balance']
-                    self._balance_last_fetched = datetime.now()
+                    self._balance_last_fetched = now
                     logger.info(f"Updated account balance: ${self._account_balance:.2f}")
                 else:
                     # If we can't get balance, use cached or default
@@ -1151,9 +1407,13 @@ class LiveGoldBot(BaseGoldBot):
             # Fallback to minimum position
             return self.config.MIN_POSITION
     
-    async def update_monitoring(self) -> None:
+    async def update_monitoring(self, can_trade: Optional[bool] = None) -> None:
         """Update monitoring files with live data"""
         try:
+            if can_trade is None:
+                can_trade = self.can_trade()
+            now = self._tick_now or datetime.now(timezone.utc)
+            
             # Get current positions
             positions = await self.api_client.get_positions()
             # Make sure positions is a list, not None
@@ -1165,7 +1425,7 @@ class LiveGoldBot(BaseGoldBot):
             
             # Format status data to match monitor expectations
             status_data = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now,
                 "is_alive": self.is_running,
                 "mode": "PRACTICE" if self.config.PAPER_TRADING else "LIVE",
                 "account": {
@@ -1176,8 +1436,8 @@ class LiveGoldBot(BaseGoldBot):
                     "total_trades": self.total_trades
                 },
                 "trading": {
-                    "can_trade": self.can_trade(),
-                    "last_signal": self.last_signal_time.isoformat() if hasattr(self, 'last_signal_time') and self.last_signal_time else None,
+                    "can_trade": can_trade,
+                    "last_signal": self.last_signal_time,
                     "current_stage": self.config.TRADING_STAGE
                 },
                 "risk": {
@@ -1186,14 +1446,14 @@ class LiveGoldBot(BaseGoldBot):
                     "max_risk_per_trade": self.config.MAX_RISK_PER_TRADE
                 },
                 "patterns": {
-                    "found": getattr(self, 'patterns_found_today', 0),
-                    "high_quality": getattr(self, 'high_quality_patterns_today', 0)
+                    "found": self.patterns_found_today,
+                    "high_quality": self.high_quality_patterns_today
                 },
                 "performance": {
                     "total_trades": self.total_trades,
-                    "winners": getattr(self, 'winning_trades', 0),
-                    "losers": getattr(self, 'losing_trades', 0),
-                    "win_rate": (getattr(self, 'winning_trades', 0) / self.total_trades * 100) if self.total_trades > 0 else 0
+                    "winners": self.winning_trades,
+                    "losers": self.losing_trades,
+                    "win_rate": (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
                 },
                 "partial_profits": {
                     "enabled": self.config.ENABLE_PARTIAL_PROFITS,
@@ -1201,16 +1461,28 @@ class LiveGoldBot(BaseGoldBot):
                     "targets": self.config.PARTIAL_PROFIT_PERCENTAGES if self.config.ENABLE_PARTIAL_PROFITS else {}
                 },
                 "current_price": self.current_price,
-                "next_update": (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+                "next_update": now + timedelta(seconds=self.config.MONITORING_UPDATE_INTERVAL)
             }
             
-            # Write status to file (write_json is synchronous, not async)
-            import json
-            from pathlib import Path
-            status_file = Path('logs/status.json')
-            status_file.parent.mkdir(exist_ok=True)
-            with open(status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
+            # Skip the write if nothing material changed, but still refresh
+            # periodically so monitors can use the file as a heartbeat
+            status_hash = hash(json.dumps(
+                {k: v for k, v in status_data.items() if k not in ('timestamp', 'next_update')},
+                sort_keys=True,
+                default=str
+            ))
+            now_mono = time.monotonic()
+            if (status_hash == self._last_status_hash and
+                    now_mono - self._last_status_write < self.config.STATUS_HEARTBEAT_SECONDS):
+                return
+            
+            # Write status atomically (temp file + rename) so readers never see a partial file;
+            # the fsync runs in a worker thread so it doesn't stall the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.file_ops['writer'].write_json, self._status_file, status_data
+            )
+            self._last_status_hash = status_hash
+            self._last_status_write = now_mono
             
         except Exception as e:
             logger.error(f"Error updating monitoring: {e}")
\ No newline at end of file
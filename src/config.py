@@ -2,44 +2,74 @@
 # Standard library imports
 import os
 from datetime import time
+from types import MappingProxyType
 from typing import Dict, List
 
 # Third-party imports
 from dotenv import load_dotenv
 
 # Local imports
-from .contracts import CONTRACTS, adjust_pattern_parameters, calculate_position_size, get_contract
+from .contracts import CONTRACTS, PATTERN_PARAMS, calculate_position_size, get_contract
 
 # Load environment variables
 load_dotenv()
 
+# Environment variables read by Config
+_ENV_KEYS = (
+    'TRADING_CONTRACT',
+    'TOPSTEP_API_KEY',
+    'TOPSTEP_API_SECRET',
+    'TOPSTEP_USERNAME',
+    'TOPSTEP_USER_ID',
+    'TOPSTEP_ACCOUNT_ID',
+    'TOPSTEP_MARKET',
+    'PAPER_TRADING',
+    'TOPSTEP_STEP1_ACCOUNT_ID',
+    'TOPSTEP_PRACTICE_ACCOUNT_ID',
+    'TOPSTEP_API_BASE_URL',
+    'TOPSTEP_RTC_BASE_URL',
+    'TOPSTEP_WS_DATA_URL',
+    'TOPSTEP_WS_TRADING_URL',
+    'DEFAULT_ACCOUNT_SIZE'
+)
+
+# Read-only snapshot of the environment, taken once after .env is loaded
+_ENV = MappingProxyType({key: os.environ[key] for key in _ENV_KEYS if key in os.environ})
+
+# Credentials that must be set, and the .env template values that mean "not set"
+_REQUIRED_CREDENTIALS = ('TOPSTEP_API_KEY', 'TOPSTEP_API_SECRET', 'TOPSTEP_ACCOUNT_ID')
+_PLACEHOLDERS = frozenset({'your_api_key_here', 'your_api_secret_here', 'your_account_id_here', 'your_account_id'})
+
+# Values accepted as "on" for boolean environment flags (compared lowercased)
+_TRUTHY = frozenset({'true', '1', 'yes'})
+
 # Get the selected contract early to avoid initialization issues
-_TRADING_CONTRACT = os.getenv('TRADING_CONTRACT', 'MNQ')
+_TRADING_CONTRACT = _ENV.get('TRADING_CONTRACT', 'MNQ')
 _selected_contract = get_contract(_TRADING_CONTRACT)
 
 class Config:
     # API Settings
-    TOPSTEP_API_KEY = os.getenv('TOPSTEP_API_KEY')
-    TOPSTEP_API_SECRET = os.getenv('TOPSTEP_API_SECRET')
-    TOPSTEP_USERNAME = os.getenv('TOPSTEP_USERNAME')
-    TOPSTEP_USER_ID = os.getenv('TOPSTEP_USER_ID')
-    TOPSTEP_ACCOUNT_ID = os.getenv('TOPSTEP_ACCOUNT_ID')
-    TOPSTEP_MARKET = os.getenv('TOPSTEP_MARKET', 'CME_TOB')
-    PAPER_TRADING = os.getenv('PAPER_TRADING', 'True').lower() == 'true'
+    TOPSTEP_API_KEY = _ENV.get('TOPSTEP_API_KEY')
+    TOPSTEP_API_SECRET = _ENV.get('TOPSTEP_API_SECRET')
+    TOPSTEP_USERNAME = _ENV.get('TOPSTEP_USERNAME')
+    TOPSTEP_USER_ID = _ENV.get('TOPSTEP_USER_ID')
+    TOPSTEP_ACCOUNT_ID = _ENV.get('TOPSTEP_ACCOUNT_ID')
+    TOPSTEP_MARKET = _ENV.get('TOPSTEP_MARKET', 'CME_TOB')
+    PAPER_TRADING = _ENV.get('PAPER_TRADING', 'True').lower() in _TRUTHY
     
     # Trading Contract Selection
     TRADING_CONTRACT = _TRADING_CONTRACT
     _contract = _selected_contract
     
     # Account IDs (from environment variables)
-    STEP1_ACCOUNT_ID = int(os.getenv('TOPSTEP_STEP1_ACCOUNT_ID', '9203477'))  # Step 1 evaluation
-    PRACTICE_ACCOUNT_ID = int(os.getenv('TOPSTEP_PRACTICE_ACCOUNT_ID', '9156522'))  # Practice account
+    STEP1_ACCOUNT_ID = int(_ENV.get('TOPSTEP_STEP1_ACCOUNT_ID', '9203477'))  # Step 1 evaluation
+    PRACTICE_ACCOUNT_ID = int(_ENV.get('TOPSTEP_PRACTICE_ACCOUNT_ID', '9156522'))  # Practice account
     
     # API URLs
-    TOPSTEP_API_BASE_URL = os.getenv('TOPSTEP_API_BASE_URL', 'https://api.topstepx.com')
-    TOPSTEP_RTC_BASE_URL = os.getenv('TOPSTEP_RTC_BASE_URL', 'https://rtc.topstepx.com')
-    TOPSTEP_WS_DATA_URL = os.getenv('TOPSTEP_WS_DATA_URL', 'wss://rtc.topstepx.com/hubs/market')
-    TOPSTEP_WS_TRADING_URL = os.getenv('TOPSTEP_WS_TRADING_URL', 'wss://rtc.topstepx.com/hubs/user')
+    TOPSTEP_API_BASE_URL = _ENV.get('TOPSTEP_API_BASE_URL', 'https://api.topstepx.com')
+    TOPSTEP_RTC_BASE_URL = _ENV.get('TOPSTEP_RTC_BASE_URL', 'https://rtc.topstepx.com')
+    TOPSTEP_WS_DATA_URL = _ENV.get('TOPSTEP_WS_DATA_URL', 'wss://rtc.topstepx.com/hubs/market')
+    TOPSTEP_WS_TRADING_URL = _ENV.get('TOPSTEP_WS_TRADING_URL', 'wss://rtc.topstepx.com/hubs/user')
     
     # Contract Specifications (dynamically loaded from selected contract)
     SYMBOL = _selected_contract.symbol
@@ -48,7 +78,7 @@ class Config:
     TICK_SIZE = _selected_contract.tick_size
     TICK_VALUE = _selected_contract.tick_value
     CONTRACT_VOLATILITY = _selected_contract.volatility
-    CONTRACT_MONTHS = ['H', 'M', 'U', 'Z']  # Mar, Jun, Sep, Dec
+    CONTRACT_MONTHS = ('H', 'M', 'U', 'Z')  # Mar, Jun, Sep, Dec
     
     @classmethod
     def get_active_contract(cls) -> str:
@@ -71,7 +101,7 @@ class Config:
     DEFAULT_POSITION = _selected_contract.default_position
     
     # Risk Parameters (TopStep Rules)
-    DEFAULT_ACCOUNT_SIZE = float(os.getenv('DEFAULT_ACCOUNT_SIZE', '150000'))  # Default if API unavailable
+    DEFAULT_ACCOUNT_SIZE = float(_ENV.get('DEFAULT_ACCOUNT_SIZE', '150000'))  # Default if API unavailable
     DAILY_LOSS_LIMIT = 800  # Hard stop
     TRAILING_DRAWDOWN = 2000  # TopStep trailing
     MAX_RISK_PER_TRADE = 500
@@ -84,7 +114,7 @@ class Config:
     NEWS_BLACKOUT_START = time(22, 45)  # No new trades
     
     # Pattern Detection Settings (dynamically adjusted for contract volatility)
-    _pattern_params = adjust_pattern_parameters(_selected_contract)
+    _pattern_params = PATTERN_PARAMS[_selected_contract.symbol]
     MIN_PATTERN_SCORE = _pattern_params['min_pattern_score']
     LOOKBACK_CANDLES = _pattern_params['lookback_candles']
     MIN_VOLUME_RATIO = _pattern_params['min_volume_ratio']
@@ -150,6 +180,18 @@ class Config:
     SIGNAL_COOLDOWN_SECONDS = 300  # Wait 5 minutes after placing a trade
     MAIN_LOOP_DELAY_SECONDS = 30  # Main trading loop iteration delay
     MONITORING_UPDATE_INTERVAL = 30  # Update status files every 30 seconds
+    STATUS_HEARTBEAT_SECONDS = 30  # Rewrite an unchanged status file at least this often (check_status.py flags >120s as stale)
+    
+    # Bar length per timeframe (seconds); cached candles expire when the current bar closes
+    CANDLE_BAR_SECONDS = {
+        '1m': 60,
+        '5m': 300,
+        '15m': 900,
+        '30m': 1800,
+        '1h': 3600
+    }
+    CANDLE_CACHE_MAX_AGE = 60  # Refetch at least this often so the forming bar stays fresh (seconds)
+    CANDLE_CACHE_MAX_ENTRIES = 128
     
     # File Operation Parameters
     MAX_FILE_RETRY_ATTEMPTS = 3  # Retry file operations this many times
@@ -161,6 +203,9 @@ class Config:
     WEBSOCKET_MAX_RECONNECT_DELAY = 300  # Max reconnect delay (5 minutes)
     CIRCUIT_BREAKER_THRESHOLD = 5  # Open circuit after 5 failures
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60  # Try again after 60 seconds
+    MAX_CONCURRENT_ORDERS = 8  # Cap on simultaneous order requests (broker rate limits)
+    MAX_TRADE_HISTORY = 10_000  # Trades kept in memory for summaries (oldest are dropped)
+    QUOTE_MAX_AGE_SECONDS = 2.0  # Streamed prices older than this fall back to REST
     
     @classmethod
     def calculate_dynamic_position_size(cls, account_balance: float = None) -> int:
@@ -195,21 +240,22 @@ class Config:
     @classmethod
     def get_all_config_values(cls) -> Dict:
         """Get all configuration values as a dictionary"""
-        return {
-            key: value for key, value in cls.__dict__.items()
-            if not key.startswith('_') and not callable(value)
-        }
+        return {key: getattr(cls, key) for key in cls._CONFIG_KEYS}
     
     @classmethod
     def validate_config(cls) -> bool:
         """Validate critical configuration settings"""
-        if not cls.TOPSTEP_API_KEY or cls.TOPSTEP_API_KEY == 'your_api_key_here':
-            raise ValueError("TOPSTEP_API_KEY not configured in .env file")
-        
-        if not cls.TOPSTEP_API_SECRET or cls.TOPSTEP_API_SECRET == 'your_api_secret_here':
-            raise ValueError("TOPSTEP_API_SECRET not configured in .env file")
+        for key in _REQUIRED_CREDENTIALS:
+            value = getattr(cls, key)
+            if not value or value in _PLACEHOLDERS:
+                raise ValueError(f"{key} not configured in .env file")
         
-        if not cls.TOPSTEP_ACCOUNT_ID or cls.TOPSTEP_ACCOUNT_ID == 'your_account_id_here':
-            raise ValueError("TOPSTEP_ACCOUNT_ID not configured in .env file")
-        
-        return True
\ No newline at end of file
+        return True
+    
+    # Names of the configuration values, collected once from the class body.
+    # Values are read on each call since some (e.g. PAPER_TRADING) are set at runtime.
+    _CONFIG_KEYS = tuple(
+        key for key, value in list(locals().items())
+        if not key.startswith('_') and not callable(value)
+        and not isinstance(value, (classmethod, staticmethod))
+    )
\ No newline at end of file
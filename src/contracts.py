@@ -1,10 +1,13 @@
 """Contract Registry for Trading Bot"""
 # Standard library imports
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence
 
+# Third-party imports
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
 class ContractSpec:
     """Contract specification with all necessary parameters"""
     symbol: str  # Base symbol
@@ -25,6 +28,23 @@ class ContractSpec:
     primary_timeframe: str  # Primary analysis timeframe
     htf_timeframe: str  # Higher timeframe for trend
     entry_timeframe: str  # Entry timing timeframe
+    
+    # Dollar risk per contract at each stop distance (derived, not passed in)
+    stop_dollar_min: float = field(init=False, repr=False, compare=False)
+    stop_dollar_max: float = field(init=False, repr=False, compare=False)
+    stop_dollar_default: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived values are set through object.__setattr__
+        object.__setattr__(self, 'stop_dollar_min', self.min_stop_ticks * self.tick_value)
+        object.__setattr__(self, 'stop_dollar_max', self.max_stop_ticks * self.tick_value)
+        object.__setattr__(self, 'stop_dollar_default', self.default_stop_ticks * self.tick_value)
+    
+    def __reduce_ex__(self, protocol):
+        """Pickle registered contracts by symbol so other processes resolve them from CONTRACTS"""
+        if CONTRACTS.get(self.symbol) is self:
+            return (get_contract, (self.symbol,))
+        return super().__reduce_ex__(protocol)
 
 
 # Contract Registry
@@ -163,17 +183,28 @@ CONTRACTS: Dict[str, ContractSpec] = {
 }
 
 
+# Structure-of-arrays view of the sizing fields, one row per contract in CONTRACTS order
+_CONTRACT_INDEX: Dict[str, int] = {symbol: i for i, symbol in enumerate(CONTRACTS)}
+_CONTRACT_TABLE: Dict[str, np.ndarray] = {
+    'stop_dollar_default': np.array([c.stop_dollar_default for c in CONTRACTS.values()], dtype=np.float64),
+    'volatility': np.array([c.volatility for c in CONTRACTS.values()], dtype=np.float64),
+    'min_position': np.array([c.min_position for c in CONTRACTS.values()], dtype=np.int64),
+    'max_position': np.array([c.max_position for c in CONTRACTS.values()], dtype=np.int64)
+}
+
+
 def get_contract(symbol: str) -> ContractSpec:
     """Get contract specification by symbol"""
-    if symbol not in CONTRACTS:
+    contract = CONTRACTS.get(symbol)
+    if contract is None:
         raise ValueError(f"Unknown contract symbol: {symbol}")
-    return CONTRACTS[symbol]
+    return contract
 
 
 def calculate_position_size(contract: ContractSpec, account_balance: float, risk_per_trade: float) -> int:
     """Calculate position size based on contract and risk parameters"""
     # Calculate maximum position based on risk
-    risk_position = int(risk_per_trade / (contract.default_stop_ticks * contract.tick_value))
+    risk_position = int(risk_per_trade / contract.stop_dollar_default)
     
     # Apply contract limits
     position_size = max(contract.min_position, min(risk_position, contract.max_position))
@@ -185,6 +216,30 @@ def calculate_position_size(contract: ContractSpec, account_balance: float, risk
     return position_size
 
 
+def calculate_position_size_batch(symbols: Sequence[str], risks_per_trade) -> np.ndarray:
+    """Vectorized calculate_position_size over many (contract, risk) pairs
+
+    `risks_per_trade` may be a scalar or an array broadcastable against `symbols`.
+    """
+    try:
+        idx = np.fromiter((_CONTRACT_INDEX[s] for s in symbols), dtype=np.intp, count=len(symbols))
+    except KeyError as e:
+        raise ValueError(f"Unknown contract symbol: {e.args[0]}") from None
+    
+    stop_dollar = _CONTRACT_TABLE['stop_dollar_default'][idx]
+    min_position = _CONTRACT_TABLE['min_position'][idx]
+    max_position = _CONTRACT_TABLE['max_position'][idx]
+    
+    # Risk-based size, truncated like int() and clipped to contract limits
+    risk_position = (np.asarray(risks_per_trade, dtype=np.float64) / stop_dollar).astype(np.int64)
+    position_size = np.clip(risk_position, min_position, max_position)
+    
+    # Adjust for high volatility contracts
+    high_vol = _CONTRACT_TABLE['volatility'][idx] > 1.3
+    reduced = np.maximum(min_position, (position_size * 0.8).astype(np.int64))
+    return np.where(high_vol, reduced, position_size)
+
+
 def adjust_pattern_parameters(contract: ContractSpec) -> Dict[str, Any]:
     """Adjust pattern detection parameters based on contract volatility"""
     base_lookback = 100
@@ -207,5 +262,12 @@ def adjust_pattern_parameters(contract: ContractSpec) -> Dict[str, Any]:
     }
 
 
+# Pattern parameters for every registered contract (CONTRACTS is static)
+PATTERN_PARAMS: Dict[str, Dict[str, Any]] = {
+    symbol: adjust_pattern_parameters(spec) for symbol, spec in CONTRACTS.items()
+}
+
+
 # Export all necessary items
-__all__ = ['CONTRACTS', 'ContractSpec', 'get_contract', 'calculate_position_size', 'adjust_pattern_parameters']
\ No newline at end of file
+__all__ = ['CONTRACTS', 'PATTERN_PARAMS', 'ContractSpec', 'get_contract', 'calculate_position_size',
+           'calculate_position_size_batch', 'adjust_pattern_parameters']
\ No newline at end of file
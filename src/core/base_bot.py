@@ -4,6 +4,7 @@ import asyncio
 import json
 import os
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
@@ -17,6 +18,21 @@ from src.utils.data_validator import DataValidator, DataValidationError
 from src.utils.file_operations import create_safe_file_operations, safe_update_monitoring
 from src.utils.logger_setup import logger
 
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean (NaN until `window` values are available)
+    
+    Same result as Series.rolling(window).mean() up to float rounding, from a
+    single cumulative sum instead of a pandas rolling object.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        csum = np.cumsum(values, dtype=np.float64)
+        out[window - 1] = csum[window - 1] / window
+        out[window:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
 class BaseGoldBot(ABC):
     """Base class for Blue2.0 Trading Bot - shared functionality"""
     
@@ -28,7 +44,7 @@ class BaseGoldBot(ABC):
         self.daily_pnl = 0.0
         self.consecutive_losses = 0
         self.last_signal_time = None
-        self.trade_history = []
+        self.trade_history = deque(maxlen=self.config.MAX_TRADE_HISTORY)  # Oldest trades drop off
         
         # Data validation
         self.validator = DataValidator(self.config)
@@ -95,57 +111,60 @@ class BaseGoldBot(ABC):
             # Validate data first
             df = self.validator.validate_candles_df(df)
             
-            # Calculate candle properties
-            df['body_size'] = abs(df['close'] - df['open'])
-            df['avg_body'] = df['body_size'].rolling(20).mean()
+            # Candle properties as plain arrays (no per-candle pandas access)
+            open_ = df['open'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            close = df['close'].to_numpy(dtype=np.float64)
+            body_size = np.abs(close - open_)
+            avg_body = _rolling_mean(body_size, 20)
             
             # Pattern age limit - from config
             max_age = getattr(self.config, 'MAX_PATTERN_AGE_CANDLES', 50)
             start_index = max(0, len(df) - max_age)
             
-            # Basic order block detection
-            for i in range(start_index, len(df) - 1):
-                current = df.iloc[i]
-                next_candle = df.iloc[i + 1]
-                
-                # Skip if we don't have average body size yet
-                if pd.isna(current['avg_body']) or current['avg_body'] <= 0:
-                    continue
+            # Candle i (current) against candle i + 1 (next) over the scan window
+            cur = slice(start_index, len(df) - 1)
+            nxt = slice(start_index + 1, len(df))
+            
+            # Need an average body size; body must be large (1.2x, reduced from 1.5x)
+            large_body = (avg_body[cur] > 0) & (body_size[cur] > avg_body[cur] * 1.2)
+            
+            # Bullish: red candle, next is green and closes above its high
+            bullish = (large_body & (close[cur] < open_[cur]) &
+                       (close[nxt] > high[cur]) & (close[nxt] > open_[nxt]))
+            # Bearish: green candle, next is red and closes below its low
+            bearish = (large_body & (close[cur] > open_[cur]) &
+                       (close[nxt] < low[cur]) & (close[nxt] < open_[nxt]))
+            
+            # Build dicts only for the hits, in candle order
+            timestamps = df['timestamp']
+            for offset in np.flatnonzero(bullish | bearish):
+                i = int(start_index + offset)
                 
                 # Calculate strength (capped at 3.0)
-                strength = min(current['body_size'] / current['avg_body'], 3.0)
+                strength = min(body_size[i] / avg_body[i], 3.0)
                 
-                # Bullish Order Block
-                if (current['close'] < current['open'] and  # Red candle
-                    current['body_size'] > current['avg_body'] * 1.2 and  # Large body (reduced from 1.5)
-                    next_candle['close'] > current['high'] and  # Next breaks high
-                    next_candle['close'] > next_candle['open']):  # Next is green
-                    
+                if bullish[offset]:
                     order_blocks.append({
                         'type': 'bullish',
-                        'level': current['low'],
-                        'top': current['high'],
+                        'level': low[i],
+                        'top': high[i],
                         'index': i,
-                        'timestamp': current['timestamp'],
+                        'timestamp': timestamps.iloc[i],
                         'strength': strength
                     })
-                    logger.debug(f"Found bullish OB at index {i}, level: ${current['low']:.2f}")
-                
-                # Bearish Order Block
-                elif (current['close'] > current['open'] and  # Green candle
-                      current['body_size'] > current['avg_body'] * 1.2 and  # Large body (reduced from 1.5)
-                      next_candle['close'] < current['low'] and  # Next breaks low
-                      next_candle['close'] < next_candle['open']):  # Next is red
-                    
+                    logger.debug(f"Found bullish OB at index {i}, level: ${low[i]:.2f}")
+                else:
                     order_blocks.append({
                         'type': 'bearish',
-                        'level': current['high'],
-                        'bottom': current['low'],
+                        'level': high[i],
+                        'bottom': low[i],
                         'index': i,
-                        'timestamp': current['timestamp'],
+                        'timestamp': timestamps.iloc[i],
                         'strength': strength
                     })
-                    logger.debug(f"Found bearish OB at index {i}, level: ${current['high']:.2f}")
+                    logger.debug(f"Found bearish OB at index {i}, level: ${high[i]:.2f}")
             
             logger.info(f"Found {len(order_blocks)} order blocks")
             return order_blocks
@@ -157,56 +176,89 @@ class BaseGoldBot(ABC):
             logger.error(f"Error in order block detection: {e}")
             return []
     
-    def calculate_pattern_score(self, pattern: Dict, df: pd.DataFrame) -> float:
-        """Calculate quality score for a pattern (1-10) - shared implementation"""
-        score = 0.0
+    def calculate_pattern_score(self, pattern: Dict, df: pd.DataFrame,
+                                avg_volume: Optional[np.ndarray] = None) -> float:
+        """Calculate quality score for a pattern (1-10) - shared implementation
+        
+        `avg_volume` is the 20-candle rolling mean of df['volume'] as an array;
+        pass it when scoring several patterns against the same candles.
+        """
+        score = float(self.calculate_pattern_scores_batch([pattern], df, avg_volume)[0])
+        logger.debug(f"Pattern score: {score:.1f}")
+        return score
+    
+    def calculate_pattern_scores_batch(self, patterns: List[Dict], df: pd.DataFrame,
+                                       avg_volume: Optional[np.ndarray] = None) -> np.ndarray:
+        """Score several patterns against the same candles in one pass
+        
+        Returns an array aligned with `patterns`; invalid patterns score 0.
+        """
+        scores = np.zeros(len(patterns))
+        if not patterns:
+            return scores
         
         try:
-            # Validate pattern first
-            pattern = self.validator.validate_pattern(pattern)
-            
-            # Base score for pattern strength (capped)
-            score += min(pattern.get('strength', 1.0) * 2, 3)  # Max 3 points
-            
-            # Volume confirmation
-            pattern_idx = pattern['index']
-            if pattern_idx < len(df):
-                candle = df.iloc[pattern_idx]
-                avg_volume = df['volume'].rolling(20).mean().iloc[pattern_idx]
-                if not pd.isna(avg_volume) and avg_volume > 0 and candle['volume'] > avg_volume * 1.5:
-                    score += 2  # Volume spike bonus
-            
-            # Recency bonus
-            age = len(df) - pattern['index']
-            if age < 10:
-                score += 2
-            elif age < 25:
-                score += 1
+            # Validate patterns and gather their fields into arrays
+            valid = np.zeros(len(patterns), dtype=bool)
+            indexes = np.zeros(len(patterns), dtype=np.int64)
+            levels = np.zeros(len(patterns))
+            strengths = np.zeros(len(patterns))
+            bullish = np.zeros(len(patterns), dtype=bool)
+            for k, pattern in enumerate(patterns):
+                try:
+                    pattern = self.validator.validate_pattern(pattern)
+                except DataValidationError as e:
+                    logger.error(f"Pattern validation error: {e}")
+                    continue
+                valid[k] = True
+                indexes[k] = pattern['index']
+                levels[k] = pattern['level']
+                strengths[k] = pattern.get('strength', 1.0)
+                bullish[k] = pattern['type'] == 'bullish'
             
-            # Clean move bonus
-            tolerance = getattr(self.config, 'PATTERN_VIOLATION_TOLERANCE', 0.002)
+            in_range = indexes < len(df)
+            volume_spike = np.zeros(len(patterns), dtype=bool)
+            not_violated = np.zeros(len(patterns), dtype=bool)
+            if in_range.any():
+                candle_idx = np.where(in_range, indexes, 0)
+                
+                # Volume confirmation
+                if avg_volume is None:
+                    avg_volume = self._rolling_avg_volume(df)
+                pattern_avg = avg_volume[candle_idx]
+                volume = df['volume'].to_numpy()[candle_idx]
+                volume_spike = in_range & (pattern_avg > 0) & (volume > pattern_avg * 1.5)
+                
+                # Clean move: lowest low / highest high from each pattern onwards
+                tolerance = getattr(self.config, 'PATTERN_VIOLATION_TOLERANCE', 0.002)
+                recent_low = np.minimum.accumulate(df['low'].to_numpy()[::-1])[::-1][candle_idx]
+                recent_high = np.maximum.accumulate(df['high'].to_numpy()[::-1])[::-1][candle_idx]
+                not_violated = in_range & np.where(
+                    bullish,
+                    recent_low > levels * (1 - tolerance),
+                    recent_high < levels * (1 + tolerance)
+                )
             
-            if pattern['type'] == 'bullish':
-                recent_low = df['low'].iloc[pattern['index']:].min()
-                if recent_low > pattern['level'] * (1 - tolerance):  # Not violated
-                    score += 2
-            else:  # bearish
-                recent_high = df['high'].iloc[pattern['index']:].max()
-                if recent_high < pattern['level'] * (1 + tolerance):  # Not violated
-                    score += 2
+            # Points, always summed in this order
+            age = len(df) - indexes
+            scores += np.minimum(strengths * 2, 3)  # Strength, max 3 points
+            scores += np.where(volume_spike, 2, 0)  # Volume spike bonus
+            scores += np.where(age < 10, 2, np.where(age < 25, 1, 0))  # Recency bonus
+            scores += np.where(not_violated, 2, 0)  # Clean move bonus
             
             # Cap score at 10
-            score = min(score, 10)
-            
-            logger.debug(f"Pattern score: {score:.1f}")
-            return score
+            scores = np.minimum(scores, 10)
+            scores[~valid] = 0.0
+            return scores
             
-        except DataValidationError as e:
-            logger.error(f"Pattern validation error: {e}")
-            return 0.0
         except Exception as e:
             logger.error(f"Error calculating pattern score: {e}")
-            return 0.0
+            return np.zeros(len(patterns))
+    
+    @staticmethod
+    def _rolling_avg_volume(df: pd.DataFrame) -> np.ndarray:
+        """20-candle rolling mean volume, as used by calculate_pattern_score"""
+        return _rolling_mean(df['volume'].to_numpy(dtype=np.float64), 20)
     
     def can_trade(self) -> bool:
         """Check if we can place new trades - shared implementation"""
@@ -249,16 +301,16 @@ class BaseGoldBot(ABC):
         logger.info(f"Position size: {size} {self.config.SYMBOL}")
         return size
     
-    async def update_monitoring(self) -> None:
+    async def update_monitoring(self, can_trade: Optional[bool] = None) -> None:
         """Update monitoring using safe file operations"""
-        safe_update_monitoring(self, self.file_ops)
+        safe_update_monitoring(self, self.file_ops, can_trade=can_trade)
     
     async def execute_signal(self, best_signal: Dict, best_score: float, candles: pd.DataFrame) -> None:
         """Execute a trading signal - shared logic"""
         logger.info(f"High quality {best_signal['type']} signal found! Score: {best_score:.1f}")
         
         # Get current price from latest candle
-        current_price = candles.iloc[-1]['close']
+        current_price = candles['close'].iloc[-1]
         
         # Validate prices before proceeding
         try:
@@ -332,8 +384,9 @@ class BaseGoldBot(ABC):
         
         while self.is_running:
             try:
-                # Check if we can trade
-                if not self.can_trade():
+                # Check if we can trade (evaluated once per iteration)
+                can_trade_now = self.can_trade()
+                if not can_trade_now:
                     await asyncio.sleep(60)
                     continue
                 
@@ -356,11 +409,12 @@ class BaseGoldBot(ABC):
                 best_signal = None
                 best_score = 0
                 
-                for pattern in order_blocks:
-                    score = self.calculate_pattern_score(pattern, candles)
-                    if score >= self.config.MIN_PATTERN_SCORE and score > best_score:
-                        best_signal = pattern
-                        best_score = score
+                if order_blocks:
+                    scores = self.calculate_pattern_scores_batch(order_blocks, candles)
+                    best = int(np.argmax(scores))  # First of any ties, as before
+                    if scores[best] >= self.config.MIN_PATTERN_SCORE:
+                        best_signal = order_blocks[best]
+                        best_score = float(scores[best])
                 
                 # Execute best signal if found
                 if best_signal:
@@ -368,9 +422,12 @@ class BaseGoldBot(ABC):
                     
                     # Wait before looking for next signal
                     await asyncio.sleep(signal_cooldown)
+                    
+                    # State may have changed during the cooldown
+                    can_trade_now = self.can_trade()
                 
                 # Update monitoring
-                await self.update_monitoring()
+                await self.update_monitoring(can_trade=can_trade_now)
                 
                 # Wait before next iteration
                 await asyncio.sleep(main_loop_delay)
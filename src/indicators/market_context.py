@@ -1,7 +1,7 @@
 """Market context analyzer for dynamic pattern sensitivity."""
 import numpy as np
 from datetime import datetime
-from typing import Dict, Tuple, List
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,35 +10,80 @@ logger = logging.getLogger(__name__)
 class MarketContext:
     """Analyzes market conditions for dynamic pattern sensitivity."""
     
+    # Number of recent ATR values kept for the volatility regime
+    ATR_HISTORY_SIZE = 100
+    
     def __init__(self):
-        self.atr_history = []
+        self._atr_buffer = np.empty(self.ATR_HISTORY_SIZE, dtype=np.float64)
+        self._atr_head = 0  # Next slot to write
+        self._atr_count = 0
         self.volatility_window = 20
+        
+        # Last results keyed on the candle tail (see _tail_key)
+        self._atr_cache = (None, 0.0)
+        self._stats_cache = (None, (0.0, 0.0, 0.0))
+    
+    @property
+    def atr_history(self) -> np.ndarray:
+        """Recent ATR values, oldest first."""
+        if self._atr_count < self.ATR_HISTORY_SIZE:
+            return self._atr_buffer[:self._atr_count].copy()
+        return np.roll(self._atr_buffer, -self._atr_head)
+    
+    def _record_atr(self, atr: float) -> None:
+        """Add an ATR value, overwriting the oldest once the history is full."""
+        self._atr_buffer[self._atr_head] = atr
+        self._atr_head = (self._atr_head + 1) % self.ATR_HISTORY_SIZE
+        if self._atr_count < self.ATR_HISTORY_SIZE:
+            self._atr_count += 1
+    
+    @staticmethod
+    def _tail_key(candles: List[Dict]) -> Optional[Tuple]:
+        """Identify a candle list by its length and last candle.
+        
+        Earlier candles are closed, so this only changes when a bar is added or
+        the forming bar moves. Returns None (no caching) without timestamps.
+        """
+        last = candles[-1]
+        timestamp = last.get('timestamp')
+        if timestamp is None:
+            return None
+        return (len(candles), timestamp, last['high'], last['low'], last['close'])
     
     def calculate_atr(self, candles: List[Dict], period: int = 14) -> float:
         """Calculate Average True Range."""
         if len(candles) < period + 1:
             return 0.0
         
-        high_low = [abs(c['high'] - c['low']) for c in candles]
-        high_close = [abs(c['high'] - candles[i-1]['close']) for i, c in enumerate(candles[1:], 1)]
-        low_close = [abs(c['low'] - candles[i-1]['close']) for i, c in enumerate(candles[1:], 1)]
-        
-        true_ranges = []
-        for i in range(1, len(candles)):
-            tr = max(
-                high_low[i],
-                high_close[i-1] if i-1 < len(high_close) else 0,
-                low_close[i-1] if i-1 < len(low_close) else 0
-            )
-            true_ranges.append(tr)
-        
-        if len(true_ranges) >= period:
-            return np.mean(true_ranges[-period:])
-        return 0.0
+        key = self._tail_key(candles)
+        if key is not None:
+            key += (period,)
+            if key == self._atr_cache[0]:
+                return self._atr_cache[1]
+        
+        prices = np.array([(c['high'], c['low'], c['close']) for c in candles], dtype=np.float64)
+        atr = self._atr_from_arrays(prices[:, 0], prices[:, 1], prices[:, 2], period)
+        if key is not None:
+            self._atr_cache = (key, atr)
+        return atr
     
-    def get_volatility_regime(self, current_atr: float, historical_atr: List[float]) -> Tuple[str, float]:
+    @staticmethod
+    def _atr_from_arrays(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> float:
+        """Average True Range over the last `period` candles of price arrays."""
+        if len(closes) < period + 1:
+            return 0.0
+        
+        # True range: largest of high-low and the gaps from the previous close
+        prev_close = closes[:-1]
+        true_ranges = np.maximum(
+            np.abs(highs[1:] - lows[1:]),
+            np.maximum(np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close))
+        )
+        return np.mean(true_ranges[-period:])
+    
+    def get_volatility_regime(self, current_atr: float, historical_atr: Sequence[float]) -> Tuple[str, float]:
         """Determine volatility regime and adjustment factor."""
-        if not historical_atr or len(historical_atr) < 20:
+        if len(historical_atr) < 20:
             return "NORMAL", 1.0
         
         # Calculate percentile of current ATR
@@ -80,23 +125,31 @@ class MarketContext:
                 'recommendation': 'Use default settings'
             }
         
-        # Calculate ATR
-        current_atr = self.calculate_atr(candles)
-        self.atr_history.append(current_atr)
-        
-        # Keep only recent history
-        if len(self.atr_history) > 100:
-            self.atr_history = self.atr_history[-100:]
-        
-        # Get volatility regime
-        vol_regime, vol_adjustment = self.get_volatility_regime(current_atr, self.atr_history)
+        # ATR and moving averages; reused while the candle tail is unchanged
+        key = self._tail_key(candles)
+        if key is not None and key == self._stats_cache[0]:
+            current_atr, sma_20, sma_50 = self._stats_cache[1]
+        else:
+            # Extract prices once for ATR and trend
+            prices = np.array([(c['high'], c['low'], c['close']) for c in candles], dtype=np.float64)
+            closes = prices[:, 2]
+            current_atr = self._atr_from_arrays(prices[:, 0], prices[:, 1], closes)
+            sma_20 = np.mean(closes[-20:])
+            sma_50 = np.mean(closes[-50:]) if len(candles) >= 50 else sma_20
+            if key is not None:
+                self._stats_cache = (key, (current_atr, sma_20, sma_50))
+        
+        self._record_atr(current_atr)
+        
+        # Get volatility regime (percentiles don't depend on order, so pass the raw buffer)
+        vol_regime, vol_adjustment = self.get_volatility_regime(
+            current_atr, self._atr_buffer[:self._atr_count]
+        )
         
         # Get session info
         session, session_adjustment = self.get_session_adjustment()
         
         # Calculate trend
-        sma_20 = np.mean([c['close'] for c in candles[-20:]])
-        sma_50 = np.mean([c['close'] for c in candles[-50:]]) if len(candles) >= 50 else sma_20
         current_price = candles[-1]['close']
         
         if current_price > sma_20 > sma_50:
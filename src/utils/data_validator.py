@@ -1,10 +1,10 @@
 """Data validation for trading bot - CRITICAL FIX #1"""
 # Standard library imports
+import math
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
 # Third-party imports
-import numpy as np
 import pandas as pd
 
 # Local imports
@@ -40,7 +40,7 @@ class DataValidator:
             raise DataValidationError(f"{field_name} must be numeric, got {type(price)}")
         
         # Check for NaN
-        if pd.isna(price) or np.isnan(price):
+        if math.isnan(price):
             raise DataValidationError(f"{field_name} is NaN")
         
         # Check for negative or zero
@@ -7,11 +7,26 @@ import tempfile
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+# Third-party imports
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    # Fallback to the standard library encoder
+    orjson = None
+    USING_ORJSON = False
 
 # Local imports
 from .logger_setup import logger
 
+def _json_default(obj: Any) -> str:
+    """Serialize values the JSON encoder does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
 class FileOperationError(Exception):
     """Raised when file operations fail"""
     pass
@@ -22,6 +37,7 @@ class AtomicFileWriter:
     def __init__(self, max_retries: int = 3, retry_delay: float = 0.1):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self._known_dirs = set()  # Directories already created by this writer
     
     def write_json(self, filepath: str, data: Dict[str, Any]) -> None:
         """
@@ -32,8 +48,10 @@ class AtomicFileWriter:
         """
         filepath = Path(filepath)
         
-        # Ensure directory exists
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per directory, not on every write)
+        if filepath.parent not in self._known_dirs:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(filepath.parent)
         
         # Create temp file in same directory (for atomic rename)
         temp_fd, temp_path = tempfile.mkstemp(
@@ -43,9 +61,19 @@ class AtomicFileWriter:
         )
         
         try:
-            # Write to temp file
-            with os.fdopen(temp_fd, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Write to temp file (orjson serializes in C and handles datetimes natively)
+            if USING_ORJSON:
+                payload = orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY |
+                            orjson.OPT_NON_STR_KEYS)  # e.g. PARTIAL_PROFIT_PERCENTAGES has int keys
+                )
+            else:
+                payload = json.dumps(data, indent=2, default=_json_default).encode()
+            
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno())  # Force write to disk
             
@@ -220,9 +248,12 @@ def create_safe_file_operations():
         'day_handler': DayBoundaryHandler()
     }
 
-def safe_update_monitoring(bot, file_ops: Dict) -> None:
+def safe_update_monitoring(bot, file_ops: Dict, can_trade: Optional[bool] = None) -> None:
     """Safe replacement for bot's update_monitoring method"""
     try:
+        if can_trade is None:
+            can_trade = bot.can_trade()
+        
         writer = file_ops['writer']
         day_handler = file_ops['day_handler']
         
@@ -245,7 +276,7 @@ def safe_update_monitoring(bot, file_ops: Dict) -> None:
                 "total_trades": len(bot.trade_history)
             },
             "trading": {
-                "can_trade": bot.can_trade(),
+                "can_trade": can_trade,
                 "last_signal": bot.last_signal_time.isoformat() if bot.last_signal_time else None,
                 "current_stage": bot.config.TRADING_STAGE,
             },
@@ -0,0 +1,68 @@
+"""Fixed-capacity ring buffer for real-time quote ticks"""
+# Standard library imports
+from typing import Dict
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+
+
+class TickRingBuffer:
+    """Stores ticks column-wise in preallocated NumPy arrays
+
+    Each field lives in its own contiguous array, so appending a tick is a
+    handful of indexed writes and the history can be handed to NumPy/pandas
+    without rebuilding it from Python objects.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._ts = np.empty(capacity, dtype='datetime64[ns]')
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._bid = np.empty(capacity, dtype=np.float64)
+        self._ask = np.empty(capacity, dtype=np.float64)
+        self._bid_size = np.empty(capacity, dtype=np.int32)
+        self._ask_size = np.empty(capacity, dtype=np.int32)
+        self._head = 0  # Next slot to write
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp_ns: int, price: float, bid: float, ask: float,
+               bid_size: int = 0, ask_size: int = 0) -> None:
+        """Add a tick, overwriting the oldest one once the buffer is full"""
+        i = self._head
+        self._ts[i] = timestamp_ns
+        self._price[i] = price
+        self._bid[i] = bid
+        self._ask[i] = ask
+        self._bid_size[i] = bid_size
+        self._ask_size[i] = ask_size
+
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Return contiguous copies of each column, oldest tick first"""
+        columns = {
+            'timestamp': self._ts,
+            'price': self._price,
+            'bid': self._bid,
+            'ask': self._ask,
+            'bid_size': self._bid_size,
+            'ask_size': self._ask_size
+        }
+
+        if self._count < self.capacity:
+            return {name: values[:self._count].copy() for name, values in columns.items()}
+
+        # Full buffer: rotate so the oldest tick (at head) comes first
+        return {name: np.roll(values, -self._head) for name, values in columns.items()}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a DataFrame of the buffered ticks"""
+        df = pd.DataFrame(self.snapshot())
+        df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
+        return df
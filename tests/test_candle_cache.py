@@ -0,0 +1,60 @@
+"""Test candle cache expiry"""
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest
+
+# Local imports
+from src.bot_live import LiveGoldBot
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock, starting one second before a 5-minute boundary"""
+    state = {'now': 1_750_000_200.0 - 1.0}  # 1_750_000_200 is a multiple of 300
+    monkeypatch.setattr(time, 'time', lambda: state['now'])
+    return state
+
+
+@pytest.fixture
+def bot(clock):
+    """Mock-API bot whose candle endpoint counts fetches"""
+    bot = LiveGoldBot(use_mock_api=True)
+    bot.fetches = 0
+
+    async def counting_fetch(symbol, interval, limit):
+        bot.fetches += 1
+        return [
+            {'t': f'2025-07-01T10:{i:02d}:00Z', 'o': 21000.0, 'h': 21001.0, 'l': 20999.0, 'c': 21000.5, 'v': 100}
+            for i in range(limit)
+        ]
+
+    bot.api_client.get_historical_data = counting_fetch
+    return bot
+
+
+async def test_fetch_before_bar_close_not_reused_after_it(bot, clock):
+    """Candles fetched just before a bar boundary are refetched once it passes"""
+    await bot.get_candles('MGC', '5m', 50)
+    await bot.get_candles('MGC', '5m', 50)
+    assert bot.fetches == 1
+
+    clock['now'] += 1.0  # Bar closes
+    await bot.get_candles('MGC', '5m', 50)
+    assert bot.fetches == 2
+
+
+async def test_cached_candles_capped_at_max_age(bot, clock):
+    """Within a long bar, candles are still refetched after CANDLE_CACHE_MAX_AGE"""
+    await bot.get_candles('MGC', '1h', 50)
+
+    clock['now'] += bot.config.CANDLE_CACHE_MAX_AGE - 1
+    await bot.get_candles('MGC', '1h', 50)
+    assert bot.fetches == 1
+
+    clock['now'] += 1
+    await bot.get_candles('MGC', '1h', 50)
+    assert bot.fetches == 2
@@ -0,0 +1,32 @@
+"""Test configuration helpers"""
+# Third-party imports
+import pytest
+
+# Local imports
+from src.config import Config
+
+
+def test_all_config_values_excludes_methods():
+    """Only configuration values are returned, not helper methods"""
+    values = Config.get_all_config_values()
+    assert values['SYMBOL'] == Config.SYMBOL
+    assert 'validate_config' not in values
+    assert not any(key.startswith('_') for key in values)
+
+
+def test_all_config_values_reflect_runtime_changes(monkeypatch):
+    """Values set after import are reported"""
+    monkeypatch.setattr(Config, 'PAPER_TRADING', not Config.PAPER_TRADING)
+    assert Config.get_all_config_values()['PAPER_TRADING'] == Config.PAPER_TRADING
+
+
+def test_validate_config_rejects_placeholders(monkeypatch):
+    """Template values from .env.example count as missing credentials"""
+    monkeypatch.setattr(Config, 'TOPSTEP_API_KEY', 'key')
+    monkeypatch.setattr(Config, 'TOPSTEP_API_SECRET', 'your_api_secret_here')
+    monkeypatch.setattr(Config, 'TOPSTEP_ACCOUNT_ID', '12345')
+    with pytest.raises(ValueError, match="TOPSTEP_API_SECRET"):
+        Config.validate_config()
+
+    monkeypatch.setattr(Config, 'TOPSTEP_API_SECRET', 'secret')
+    assert Config.validate_config()
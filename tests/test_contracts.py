@@ -0,0 +1,37 @@
+"""Test contract registry and position sizing"""
+# Standard library imports
+import pickle
+from dataclasses import replace
+
+# Third-party imports
+import pytest
+
+# Local imports
+from src.contracts import CONTRACTS, calculate_position_size, calculate_position_size_batch
+
+
+def test_batch_sizing_matches_scalar():
+    """Vectorized sizing agrees with the per-contract calculation"""
+    symbols = list(CONTRACTS) * 4
+    risks = [r for r in (50.0, 250.0, 500.0, 5000.0) for _ in CONTRACTS]
+
+    sizes = calculate_position_size_batch(symbols, risks)
+    expected = [calculate_position_size(CONTRACTS[s], 0.0, r) for s, r in zip(symbols, risks)]
+    assert sizes.tolist() == expected
+
+
+def test_batch_sizing_unknown_symbol():
+    """Unknown symbols raise the same error as get_contract"""
+    with pytest.raises(ValueError, match="Unknown contract symbol: XYZ"):
+        calculate_position_size_batch(['MNQ', 'XYZ'], 500.0)
+
+
+def test_contract_pickles_by_symbol():
+    """Registered contracts round-trip to the registry instance; custom specs keep their fields"""
+    contract = CONTRACTS['MGC']
+    assert pickle.loads(pickle.dumps(contract)) is contract
+    assert len(pickle.dumps(contract)) < 100
+
+    custom = replace(contract, tick_value=2.0)
+    restored = pickle.loads(pickle.dumps(custom))
+    assert restored == custom and restored is not contract
@@ -0,0 +1,48 @@
+"""Test market context analysis"""
+# Third-party imports
+import pytest
+
+# Local imports
+from src.indicators.market_context import MarketContext
+
+
+def test_atr_uses_previous_close_gaps():
+    """True range includes gaps from the previous close, averaged over the period"""
+    candles = [
+        {'high': 10.0, 'low': 9.0, 'close': 9.5},
+        {'high': 12.0, 'low': 11.5, 'close': 11.8},  # Gap up: TR = 12.0 - 9.5
+        {'high': 11.0, 'low': 10.0, 'close': 10.5},  # Gap down: TR = 11.8 - 10.0
+        {'high': 11.0, 'low': 10.0, 'close': 10.2}   # Inside bar: TR = 11.0 - 10.0
+    ]
+
+    assert MarketContext().calculate_atr(candles, period=3) == pytest.approx((2.5 + 1.8 + 1.0) / 3)
+
+
+def test_atr_needs_enough_candles():
+    """Fewer than period + 1 candles gives no ATR"""
+    candles = [{'high': 10.0, 'low': 9.0, 'close': 9.5}] * 14
+    assert MarketContext().calculate_atr(candles, period=14) == 0.0
+
+
+def test_atr_history_keeps_most_recent_values():
+    """Each analysis records its ATR; only the newest ATR_HISTORY_SIZE are kept, oldest first"""
+    context = MarketContext()
+    for i in range(context.ATR_HISTORY_SIZE + 5):
+        candles = [{'high': 100.0 + i, 'low': 100.0, 'close': 100.0}] * 20
+        context.analyze_market(candles)
+
+    history = context.atr_history
+    assert len(history) == context.ATR_HISTORY_SIZE
+    assert history[0] == 5.0 and history[-1] == context.ATR_HISTORY_SIZE + 4.0
+
+
+def test_atr_recomputed_when_forming_bar_moves():
+    """Cached ATR is reused for the same candles but not once the last bar changes"""
+    context = MarketContext()
+    candles = [{'timestamp': i, 'high': 101.0, 'low': 100.0, 'close': 100.5} for i in range(20)]
+
+    first = context.calculate_atr(candles)
+    assert context.calculate_atr(candles) == first
+
+    candles[-1] = {'timestamp': 19, 'high': 111.0, 'low': 100.0, 'close': 110.0}
+    assert context.calculate_atr(candles) > first
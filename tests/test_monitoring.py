@@ -0,0 +1,80 @@
+"""Test status file monitoring updates"""
+# Standard library imports
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+from src.bot_live import LiveGoldBot
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    """Live bot with mock API writing its status files under a temp directory"""
+    monkeypatch.chdir(tmp_path)
+    Path('logs').mkdir()
+    return LiveGoldBot(use_mock_api=True)
+
+
+async def test_status_file_written_atomically(bot):
+    """Status file is valid JSON and no temp files are left behind"""
+    await bot.update_monitoring()
+
+    status = json.loads(Path('logs/status.json').read_text())
+    assert status['current_price'] == bot.current_price
+    assert not list(Path('logs').glob('*.tmp'))
+
+
+async def test_unchanged_status_skips_write(bot):
+    """Second update with identical data does not rewrite the file"""
+    await bot.update_monitoring()
+    first = json.loads(Path('logs/status.json').read_text())
+
+    await bot.update_monitoring()
+    second = json.loads(Path('logs/status.json').read_text())
+    assert second['timestamp'] == first['timestamp']
+
+    # A material change forces a rewrite
+    bot.current_price = 2051.25
+    await bot.update_monitoring()
+    third = json.loads(Path('logs/status.json').read_text())
+    assert third['current_price'] == 2051.25
+
+
+
+async def test_unchanged_status_rewritten_on_heartbeat(bot):
+    """An unchanged status file is still refreshed once the heartbeat interval passes"""
+    await bot.update_monitoring()
+    first = json.loads(Path('logs/status.json').read_text())
+
+    bot._tick_now = datetime.now(timezone.utc) + timedelta(seconds=1)
+    bot._last_status_write -= bot.config.STATUS_HEARTBEAT_SECONDS
+    await bot.update_monitoring()
+    second = json.loads(Path('logs/status.json').read_text())
+    assert second['timestamp'] != first['timestamp']
+
+
+async def test_status_datetimes_serialized_as_iso(bot):
+    """Datetime fields are written as ISO 8601 strings"""
+    bot.last_signal_time = datetime(2025, 7, 1, 14, 30, tzinfo=timezone.utc)
+    await bot.update_monitoring()
+
+    status = json.loads(Path('logs/status.json').read_text())
+    assert status['trading']['last_signal'] == '2025-07-01T14:30:00+00:00'
+    assert datetime.fromisoformat(status['timestamp'])
+    assert datetime.fromisoformat(status['next_update'])
+
+
+async def test_partial_profit_targets_in_status(bot, monkeypatch):
+    """Enabled partial profits write their int-keyed targets to the status file"""
+    monkeypatch.setattr(bot.config, 'ENABLE_PARTIAL_PROFITS', True)
+    await bot.update_monitoring()
+
+    status = json.loads(Path('logs/status.json').read_text())
+    assert status['partial_profits']['targets'] == {
+        str(level): pct for level, pct in bot.config.PARTIAL_PROFIT_PERCENTAGES.items()
+    }
@@ -0,0 +1,69 @@
+"""Test order block pattern scoring"""
+# Third-party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from src.bot_live import LiveGoldBot
+
+
+@pytest.fixture
+def candles():
+    """40 flat candles at 21,000 with a volume spike at 35 and a dip to 20,900 at 15"""
+    volume = np.full(40, 1000.0)
+    volume[35] = 5000.0  # 20-candle average at 35 is 1200, so 5000 is a spike
+    low = np.full(40, 20990.0)
+    low[15] = 20900.0
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2025-07-01', periods=40, freq='5min', tz='UTC'),
+        'open': np.full(40, 21000.0),
+        'high': np.full(40, 21010.0),
+        'low': low,
+        'close': np.full(40, 21000.0),
+        'volume': volume
+    })
+
+
+def _pattern(candles, kind, index, level, strength):
+    return {'type': kind, 'level': level, 'index': index,
+            'timestamp': candles['timestamp'].iloc[index], 'strength': strength}
+
+
+def test_pattern_scores(candles):
+    """Strength, volume, recency and clean-move points add up as documented"""
+    bot = LiveGoldBot(use_mock_api=True)
+    patterns = [
+        # Strength 3 (capped) + volume spike 2 + age 5 -> 2 + clean 2
+        _pattern(candles, 'bullish', 35, 20990.0, 2.0),
+        # Strength 2 + no volume average yet 0 + age 30 -> 0 + level broken by the dip 0
+        _pattern(candles, 'bullish', 10, 20990.0, 1.0),
+        # Strength 2.5 + average volume 0 + age 20 -> 1 + clean 2
+        _pattern(candles, 'bullish', 20, 20990.0, 1.25),
+        # Strength 1 + average volume 0 + age 20 -> 1 + highs never exceed the level 2
+        _pattern(candles, 'bearish', 20, 21010.0, 0.5),
+    ]
+    expected = [9.0, 2.0, 5.5, 4.0]
+
+    assert bot.calculate_pattern_scores_batch(patterns, candles).tolist() == expected
+    assert [bot.calculate_pattern_score(p, candles) for p in patterns] == expected
+
+
+def test_mtf_score_capped_at_ten(candles):
+    """Confluence on top of a maximal base score is capped at 10"""
+    bot = LiveGoldBot(use_mock_api=True)
+    pattern = _pattern(candles, 'bullish', 35, 20990.0, 2.0)
+    mtf_data = {'5m': candles, '15m': candles}
+    mtf_patterns = {'5m': [pattern], '15m': [pattern] * 5}  # 5 confluences worth 0.6 each
+
+    score = bot.calculate_mtf_pattern_score(pattern, '5m', mtf_data, mtf_patterns)
+    assert score == 10
+
+
+def test_batch_invalid_pattern_scores_zero(candles):
+    """An invalid pattern scores 0 without affecting the others"""
+    bot = LiveGoldBot(use_mock_api=True)
+    valid = _pattern(candles, 'bullish', 35, 20990.0, 2.0)
+    invalid = {'type': 'sideways', 'level': 21000.0, 'index': 10, 'timestamp': None}
+
+    assert bot.calculate_pattern_scores_batch([invalid, valid], candles).tolist() == [0.0, 9.0]
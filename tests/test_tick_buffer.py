@@ -0,0 +1,42 @@
+"""Test the NumPy tick ring buffer"""
+# Third-party imports
+import numpy as np
+
+# Local imports
+from src.utils.tick_buffer import TickRingBuffer
+
+
+def test_partial_buffer_snapshot():
+    """Snapshot of a partially filled buffer returns ticks in insertion order"""
+    buffer = TickRingBuffer(capacity=5)
+    for i in range(3):
+        buffer.append(i * 1_000_000_000, 100.0 + i, 99.75 + i, 100.25 + i, i, i + 1)
+
+    snap = buffer.snapshot()
+    assert len(buffer) == 3
+    assert snap['price'].tolist() == [100.0, 101.0, 102.0]
+    assert snap['ask_size'].tolist() == [1, 2, 3]
+
+
+def test_full_buffer_wraps_oldest_first():
+    """Once full, the oldest ticks are overwritten and the snapshot stays ordered"""
+    buffer = TickRingBuffer(capacity=4)
+    for i in range(7):
+        buffer.append(i, float(i), float(i), float(i))
+
+    snap = buffer.snapshot()
+    assert len(buffer) == 4
+    assert snap['price'].tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert snap['timestamp'].astype(np.int64).tolist() == [3, 4, 5, 6]
+    assert snap['price'].flags['C_CONTIGUOUS']
+
+
+def test_to_dataframe():
+    """DataFrame view has UTC timestamps and one row per tick"""
+    buffer = TickRingBuffer(capacity=3)
+    buffer.append(1_700_000_000_000_000_000, 21000.25, 21000.0, 21000.5, 4, 6)
+
+    df = buffer.to_dataframe()
+    assert list(df.columns) == ['timestamp', 'price', 'bid', 'ask', 'bid_size', 'ask_size']
+    assert str(df['timestamp'].dt.tz) == 'UTC'
+    assert df['price'].iloc[0] == 21000.25